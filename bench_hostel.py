@@ -0,0 +1,1042 @@
+"""Micro-benchmarks and regression checks for Hostel_management against a local MySQL.
+
+    python bench_hostel.py pool --rounds 200
+    python bench_hostel.py details-fanout --payments 12 --complaints 10 --rounds 100
+    python bench_hostel.py import-time --rounds 5
+    DB_REPLICAS=127.0.0.1:3307 python bench_hostel.py replicas
+    python bench_hostel.py import-students --rows 10000 100000
+    python bench_hostel.py allocate --rooms 5000 --students 20000
+    python bench_hostel.py reshuffle --moves 20000
+    python bench_hostel.py load --staff 10 --students 50 --duration 30
+    python bench_hostel.py complaint-search --complaints 50000
+    python bench_hostel.py reconcile --rooms 10000 --drift 0.05
+    python bench_hostel.py fee-analytics --payments 1000000
+    python bench_hostel.py complaint-burst --complaints 2000 --concurrency 50
+    python bench_hostel.py live-viewers --viewers 1 10 100 --writes 200
+    python bench_hostel.py archive --students 30000 --days 730
+    python bench_hostel.py export --sources Fee_Payment Student fee_ledger
+    python bench_hostel.py suite --scales small medium --reset --out bench_results.json
+    python bench_hostel.py --backend sqlite suite --scales small medium --reset --out bench_sqlite.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pandas as pd
+
+import Hostel_management as hm
+import seed_hostel
+
+
+def _time_calls(fn, args, rounds):
+    samples = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return {
+        "rounds": rounds,
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 3),
+    }
+
+
+# read-only handlers, so the benchmark is safe to run on a seeded database
+POOL_HANDLERS = [
+    ("get_total_students", hm.get_total_students, ()),
+    ("get_complaint_counts", hm.get_complaint_counts, ()),
+    ("dashboard_summary", hm.dashboard_summary, ()),
+    ("dashboard_data", hm.dashboard_data, ()),
+    ("view_complaints", hm.view_complaints, (None,)),
+    ("view_student_details", hm.view_student_details, (1,)),
+    ("verify_user", hm.verify_user, ("bench-nobody", "x")),
+]
+
+
+def bench_pool(rounds):
+    results = {}
+    saved = hm.DB_POOL_SIZE
+    try:
+        for mode, size in (("per_call", 0), ("pooled", saved or 5)):
+            hm.DB_POOL_SIZE = size
+            for name, fn, args in POOL_HANDLERS:
+                fn(*args)  # warm-up (fills the pool / schema caches)
+                results.setdefault(name, {})[mode] = _time_calls(fn, args, rounds)
+        results["pool_stats"] = hm.pool_stats()
+    finally:
+        hm.DB_POOL_SIZE = saved
+    return results
+
+
+def bench_details_fanout(payments, complaints, rounds, student_id=990001):
+    """view_student_details for a student with many payments *and* many
+    complaints, read cache off. The totals themselves are checked by
+    tests/test_student_details.py."""
+    saved_ttl = hm.CACHE_TTL
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        cur.execute(
+            "INSERT INTO Student (Student_ID, Name, Gender, Department) VALUES (%s, %s, %s, %s)",
+            (student_id, "Fanout Check", "Other", "BENCH")
+        )
+        cur.executemany(
+            "INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Mode) VALUES (%s, %s, %s)",
+            [(student_id, 100 + i, "Cash") for i in range(payments)]
+        )
+        cur.executemany(
+            "INSERT INTO Complaint (Student_ID, Complaint_Text) VALUES (%s, %s)",
+            [(student_id, f"fan-out check {i}") for i in range(complaints)]
+        )
+        conn.commit()
+
+        hm.CACHE_TTL = 0
+        out = {"payments": payments, "complaints": complaints}
+        out.update(_time_calls(hm.view_student_details, (student_id,), rounds))
+        return out
+    finally:
+        hm.CACHE_TTL = saved_ttl
+        cur.execute("DELETE FROM Complaint WHERE Student_ID=%s", (student_id,))
+        cur.execute("DELETE FROM Fee_Payment WHERE Student_ID=%s", (student_id,))
+        cur.execute("DELETE FROM Student WHERE Student_ID=%s", (student_id,))
+        conn.commit()
+        cur.close(); conn.close()
+
+
+# Heavy modules only the UI (hostel_ui) / first use should load, never the bare import
+IMPORT_HEAVY = ("gradio", "hostel_ui", "pandas", "numpy", "pyarrow")
+
+
+def _importtime(module):
+    """One fresh interpreter: (cumulative µs of `module`, {imported by it: cumulative µs})."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, check=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    # children are printed (indented) before their parent; the interpreter's
+    # own startup imports come first at the top level
+    seen = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if name.strip() == module:
+            return int(cumulative), seen
+        if not name[1:].startswith(" "):
+            seen = {}
+        else:
+            seen[name.strip()] = int(cumulative)
+    raise RuntimeError(f"{module} not in -X importtime output")
+
+
+def bench_import_time(rounds, module="Hostel_management"):
+    """Median python -X importtime of the data layer, its slowest imports and
+    any heavy module it pulled in. The budget and the no-UI-stack rule are
+    asserted by tests/test_import_time.py."""
+    samples, seen = [], {}
+    for _ in range(rounds):
+        total, seen = _importtime(module)
+        samples.append(total / 1000)
+    slowest = sorted(seen.items(), key=lambda x: -x[1])[:5]
+    return {
+        "import_ms": round(statistics.median(samples), 1),
+        "rounds": rounds,
+        "slowest": {n: round(us / 1000, 1) for n, us in slowest},
+        "heavy_loaded": sorted(m for m in seen if m.split(".")[0] in IMPORT_HEAVY),
+    }
+
+
+def _replica_reads():
+    return sum(r["reads"] for r in hm.replica_stats()["replicas"])
+
+
+def check_replica_routing(student_id=990002, amount=777.0, poll_s=0.05):
+    """Regression check for read/write routing (needs DB_REPLICAS): reads go
+    to a replica, data just written is read back from the primary (pinned
+    by cache tag), and reads fall back to the primary when no replica is
+    usable."""
+    if not hm.DB_REPLICAS:
+        raise SystemExit("set DB_REPLICAS (e.g. 127.0.0.1:3307) to check replica routing")
+    saved_ttl, hm.CACHE_TTL = hm.CACHE_TTL, 0
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        cur.execute("INSERT INTO Student (Student_ID, Name, Gender, Department) VALUES (%s, %s, %s, %s)",
+                    (student_id, "Replica Check", "Other", "BENCH"))
+        conn.commit()
+        time.sleep(hm.DB_REPLICA_MAX_LAG)
+
+        before = _replica_reads()
+        assert not hm._is_error_result(hm.dashboard_summary())
+        assert _replica_reads() > before, "cached read handler did not use a replica"
+
+        # read-your-writes: the student's tag is pinned to the primary after the write
+        assert hm.add_payment(student_id, amount, "Cash").startswith("✅")
+        before = _replica_reads()
+        paid = float(hm.view_student_details(student_id)["Total_Fees_Paid"].iloc[0])
+        assert paid == amount, (paid, amount)
+        assert _replica_reads() == before, "read straight after the write went to a replica"
+        assert not hm._is_error_result(hm.view_complaints(None))
+        assert _replica_reads() > before, "a read of untouched data was pinned to the primary"
+
+        # how long until a replica serves the payment (after the window)
+        t0 = time.perf_counter()
+        time.sleep(hm.DB_REPLICA_MAX_LAG)
+        visible_after = None
+        deadline = time.perf_counter() + 10 * hm.DB_REPLICA_MAX_LAG
+        while time.perf_counter() < deadline:
+            df = hm.view_student_details(student_id)
+            if not hm._is_error_result(df) and len(df) and float(df["Total_Fees_Paid"].iloc[0] or 0) == amount:
+                visible_after = round(time.perf_counter() - t0, 3)
+                break
+            time.sleep(poll_s)
+
+        # every replica out: reads still answer, from the primary
+        replicas = hm.get_replicas()
+        saved_down = [r.down_until for r in replicas.replicas]
+        for r in replicas.replicas:
+            r.down_until = float("inf")
+        fallbacks = replicas.fallbacks
+        assert not hm._is_error_result(hm.dashboard_summary())
+        assert replicas.fallbacks > fallbacks, "no fallback to the primary"
+        for r, until in zip(replicas.replicas, saved_down):
+            r.down_until = until
+        return {"ok": visible_after is not None, "lag_window_s": hm.DB_REPLICA_MAX_LAG,
+                "replica_visible_after_s": visible_after, **hm.replica_stats()}
+    finally:
+        hm.CACHE_TTL = saved_ttl
+        cur.execute("DELETE FROM Fee_Payment WHERE Student_ID=%s", (student_id,))
+        cur.execute("DELETE FROM Student WHERE Student_ID=%s", (student_id,))
+        conn.commit()
+        cur.close(); conn.close()
+
+
+BENCH_BLOCK = "ZB"           # rooms created by the benchmarks live in this block
+BENCH_ID_BASE = 5_000_000    # synthetic Student_IDs start here
+
+
+def _create_bench_rooms(cur, n, capacity=4):
+    cur.executemany(
+        "INSERT INTO Room (Block_Name, Room_No, Capacity, Current_Occupancy) VALUES (%s, %s, %s, 0)",
+        [(BENCH_BLOCK, f"{BENCH_BLOCK}-{i}", capacity) for i in range(n)]
+    )
+    cur.execute("SELECT Room_ID FROM Room WHERE Block_Name=%s ORDER BY Room_ID", (BENCH_BLOCK,))
+    return [r[0] for r in cur.fetchall()]
+
+
+def _cleanup_bench_rows(conn, cur):
+    cur.execute("DELETE FROM Student WHERE Student_ID >= %s", (BENCH_ID_BASE,))
+    cur.execute("DELETE FROM Room WHERE Block_Name=%s", (BENCH_BLOCK,))
+    conn.commit()
+
+
+def bench_import_students(sizes, chunk_size):
+    results = []
+    for n in sizes:
+        conn = hm.get_connection(); cur = conn.cursor()
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        try:
+            rooms = _create_bench_rooms(cur, n // 4 + 1)
+            conn.commit()
+            with os.fdopen(fd, "w", newline="") as fh:
+                w = csv.writer(fh)
+                w.writerow(["Student_ID", "Name", "Gender", "Department", "Room_ID"])
+                for i in range(n):
+                    w.writerow([BENCH_ID_BASE + i, f"Bench {i}", ("Male", "Female")[i % 2], "BENCH", rooms[i // 4]])
+            report = hm.import_students_csv(path, chunk_size)
+            report.pop("rejects")
+            results.append({"rows": n, "chunk_size": chunk_size, **report})
+        finally:
+            os.unlink(path)
+            _cleanup_bench_rows(conn, cur)
+            cur.close(); conn.close()
+    return results
+
+
+def bench_allocate(n_rooms, n_students, seed=42, group_share=0.15):
+    """In-memory allocation planner only (no database): synthetic rooms with
+    2-4 beds over five blocks, students with gender/department/block
+    preferences and groups of three."""
+    rng = random.Random(seed)
+    blocks = "ABCDE"
+    rooms = [hm._RoomSlot(i, blocks[i % len(blocks)], rng.choice((2, 3, 4))) for i in range(n_rooms)]
+    n_grouped = int(n_students * group_share)
+    students = [{
+        "Student_ID": i,
+        "Gender": rng.choice(("Male", "Female")),
+        "Department": rng.choice(("CSE", "ECE", "ME", "IT", "CIVIL")),
+        "Preferred_Block": rng.choice(blocks),
+        "Group": f"g{i // 3}" if i < n_grouped else None,
+    } for i in range(n_students)]
+    t0 = time.perf_counter()
+    assignments, unplaced = hm.plan_room_allocation(rooms, students)
+    elapsed = time.perf_counter() - t0
+    return {
+        "rooms": n_rooms,
+        "students": n_students,
+        "beds": sum(r.free for r in rooms) + len(assignments),
+        "assigned": len(assignments),
+        "unplaced": len(unplaced),
+        "plan_s": round(elapsed, 4),
+        "students_per_s": round(n_students / elapsed, 1) if elapsed else None,
+    }
+
+
+def bench_reshuffle(moves, seed=42):
+    """Seed about `moves` students into rooms that are mostly full, then shuffle
+    every student onto another bed of their gender (swaps and longer cycles
+    between full rooms) and time move_students from a CSV: dry run, commit,
+    and an occupancy re-check. `sequential_blocked` counts the moves the
+    per-row triggers would refuse if the same plan were applied one by one."""
+    # about 1.7 students land in each room (one gender per room), so seed a
+    # few more students than beds and reshuffle the first `moves` placed ones
+    seed_hostel.generate(max(1, moves * 10 // 17), moves * 6 // 5, 0, 0, seed=seed, reset=True)
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        cur.execute("SELECT Student_ID, Room_ID, Gender FROM Student WHERE Room_ID IS NOT NULL ORDER BY Student_ID")
+        placed = cur.fetchall()[:moves]
+        cur.execute("SELECT Room_ID, Capacity, Current_Occupancy FROM Room")
+        rooms = {rid: (cap, occ) for rid, cap, occ in cur.fetchall()}
+    finally:
+        cur.close(); conn.close()
+    rng = random.Random(seed)
+    plan = {}
+    for gender in ("Male", "Female"):
+        members = [(sid, rid) for sid, rid, g in placed if g == gender]
+        beds = [rid for _, rid in members]
+        rng.shuffle(beds)
+        plan.update((sid, bed) for (sid, _), bed in zip(members, beds))
+
+    free = {rid: cap - occ for rid, (cap, occ) in rooms.items()}
+    current = {sid: rid for sid, rid, _ in placed}
+    blocked = 0
+    for sid, rid in plan.items():
+        if rid == current[sid]:
+            continue
+        if free[rid] <= 0:
+            blocked += 1
+            continue
+        free[rid] -= 1
+        free[current[sid]] += 1
+
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="", delete=False) as fh:
+        w = csv.writer(fh)
+        w.writerow(["Student_ID", "Room_ID"])
+        w.writerows(plan.items())
+        path = fh.name
+    try:
+        out = {
+            "students": len(plan),
+            "full_rooms": sum(1 for cap, occ in rooms.values() if occ >= cap),
+            "sequential_blocked": blocked,
+        }
+        for name, dry_run in (("dry_run", True), ("commit", False)):
+            t0 = time.perf_counter()
+            r = hm.move_students(path, dry_run=dry_run)
+            elapsed = time.perf_counter() - t0
+            out[name] = {k: v for k, v in r.items() if k not in ("plan", "rejects")}
+            out[name].update(rejects=len(r["rejects"]), elapsed_s=round(elapsed, 3),
+                             moves_per_s=round(r["moves"] / elapsed, 1) if elapsed else None)
+        out["occupancy_drift_after"] = hm.reconcile_occupancy(dry_run=True)["drifted"]
+        return out
+    finally:
+        os.unlink(path)
+
+
+def _same_fee_reports(a, b):
+    for key in ("summary", "ageing", "by_mode", "by_department", "by_month", "balances"):
+        try:
+            pd.testing.assert_frame_equal(a[key], b[key], check_dtype=False)
+        except AssertionError:
+            return False
+    return True
+
+
+def bench_fee_analytics(payments, students, rounds, tail=1000, seed=42):
+    """Seed `payments` fee payments over a year, then time fee_analytics as a
+    full chunked scan, the rollup build, fee_analytics on the rollups (with
+    and without `tail` payments after the watermark) and the incremental
+    refresh. For reference, `sql_group_by` is the same per-student and
+    per-mode/month totals as plain GROUP BY queries. `consistent` checks
+    that every report frame is identical between the scan and the rollups."""
+    students = students or max(1, payments // 10)
+    seeded = seed_hostel.generate(max(1, students // 3), students, payments / students, 0, seed=seed, reset=True)
+    hm.refresh_schema()
+    out = {"seeded": seeded}
+    start = hm.term_start()
+
+    def sql_group_by():
+        conn = hm.get_connection(); cur = conn.cursor()
+        try:
+            cur.execute("SELECT Student_ID, SUM(Amount), COUNT(*), MAX(Payment_Date) FROM Fee_Payment "
+                        "WHERE Payment_Date >= %s GROUP BY Student_ID", (start,))
+            cur.fetchall()
+            cur.execute("SELECT Payment_Mode, Payment_Date, SUM(Amount), COUNT(*) FROM Fee_Payment "
+                        "GROUP BY Payment_Mode, Payment_Date")
+            cur.fetchall()
+        finally:
+            cur.close(); conn.close()
+
+    scan = hm.fee_analytics(use_rollups=False)
+    out["scan"] = _time_calls(lambda: hm.fee_analytics(use_rollups=False), (), rounds)
+    out["scan"]["timings"] = scan["timings"]
+    out["sql_group_by"] = _time_calls(sql_group_by, (), rounds)
+    out["rollup_build"] = hm.refresh_fee_rollups(rebuild=True)
+    rolled = hm.fee_analytics()
+    out["rollups"] = _time_calls(hm.fee_analytics, (), rounds)
+    out["rollups"]["timings"] = rolled["timings"]
+    out["consistent"] = _same_fee_reports(scan, rolled)
+
+    rng = random.Random(seed)
+    rows = [(rng.randint(1, students), rng.choice((5000, 15000, 20000)), date.today(),
+             rng.choice(hm.PAYMENT_MODES)) for _ in range(tail)]
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        cur.executemany("INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Date, Payment_Mode) "
+                        "VALUES (%s, %s, %s, %s)", rows)
+        conn.commit()
+    finally:
+        cur.close(); conn.close()
+    out["rollups_with_tail"] = _time_calls(hm.fee_analytics, (), rounds)
+    out["rollups_with_tail"]["tail_payments"] = tail
+    out["incremental_refresh"] = hm.refresh_fee_rollups()
+    out["consistent_after_refresh"] = _same_fee_reports(hm.fee_analytics(use_rollups=False), hm.fee_analytics())
+    out["speedup_p50"] = (round(out["scan"]["p50_ms"] / out["rollups"]["p50_ms"], 2)
+                          if out["rollups"]["p50_ms"] else None)
+    return out
+
+
+SEARCH_TERMS = ("fan", "leak", "wifi", "water leak", "door lock", "hot water", "noise", "AC")
+
+
+def bench_complaint_search(terms, rounds, complaints=None, seed=42):
+    """search_complaints via the FULLTEXT index vs a LIKE '%term%' scan, cache
+    off. With --complaints, first seeds that many complaints (about one per
+    student) on a freshly reset database."""
+    if complaints:
+        seed_hostel.generate(max(1, complaints // 3), complaints, 0, 1.0, seed=seed, reset=True)
+    saved, hm.CACHE_TTL = hm.CACHE_TTL, 0
+    results = {}
+    try:
+        for term in terms:
+            ft = _time_calls(hm.search_complaints, (term,), rounds)
+            like = _time_calls(lambda q: hm.search_complaints(q, force_like=True), (term,), rounds)
+            df, info = hm.search_complaints(term)
+            results[term] = {
+                "fulltext": ft,
+                "like": like,
+                "speedup_p50": round(like["p50_ms"] / ft["p50_ms"], 2) if ft["p50_ms"] else None,
+                "first_page": info,
+            }
+    finally:
+        hm.CACHE_TTL = saved
+    return results
+
+
+def bench_reconcile(rooms, drift_share, seed=42):
+    """Seed `rooms` rooms (about 2.5 students each), knock Current_Occupancy
+    off on `drift_share` of them behind the triggers' back, then time a dry
+    run, the fixing run and a clean re-check."""
+    seed_hostel.generate(rooms, int(rooms * 2.5), 0, 0, seed=seed, reset=True)
+    step = max(1, round(1 / drift_share)) if drift_share > 0 else 0
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        if step:
+            cur.execute("UPDATE Room SET Current_Occupancy = GREATEST(Current_Occupancy - 1, 0) + MOD(Room_ID, 2) "
+                        "WHERE MOD(Room_ID, %s) = 0", (step,))
+            conn.commit()
+    finally:
+        cur.close(); conn.close()
+    out = {"rooms": rooms, "drift_share": drift_share}
+    for name, dry_run in (("dry_run", True), ("fix", False), ("recheck", True)):
+        r = hm.reconcile_occupancy(dry_run=dry_run)
+        out[name] = {k: v for k, v in r.items() if k != "drift"}
+    return out
+
+
+def bench_archive(students, payments, complaints, days, rounds, seed=42):
+    """Seed `days` days of history, then time the complaint / student detail
+    handlers on the full tables, run archive_history for everything before
+    the current term, and time them again (hot only, and with the archive)."""
+    seeded = seed_hostel.generate(max(1, students // 3), students, payments, complaints,
+                                  seed=seed, reset=True, days=days)
+    hm.refresh_schema()
+    saved_ttl, hm.CACHE_TTL = hm.CACHE_TTL, 0
+    sid, block = 1, seed_hostel.BLOCKS[0]
+    handlers = [
+        ("view_complaints_all", hm.view_complaints, (None,)),
+        ("view_complaints_student", hm.view_complaints, (sid,)),
+        ("view_student_details", hm.view_student_details, (sid,)),
+        ("view_students_bulk_block", hm.view_students_bulk, (None, None, block)),
+    ]
+
+    def timed(include_archive=False):
+        out = {}
+        for name, fn, args in handlers:
+            call = (lambda *a, fn=fn: fn(*a, include_archive=True)) if include_archive else fn
+            call(*args)
+            out[name] = _time_calls(call, args, rounds)
+        return out
+
+    try:
+        out = {"seeded": seeded, "before_archive": timed(), "plan": hm.archive_history(dry_run=True)}
+        out["archive"] = hm.archive_history(dry_run=False, pause_ms=0)
+        out["hot_only"] = timed()
+        out["with_archive"] = timed(include_archive=True)
+        return out
+    finally:
+        hm.CACHE_TTL = saved_ttl
+
+
+BURST_TEXT = "bench burst: power cut in block"
+
+
+def bench_complaint_burst(complaints, concurrency, handler=False, batch_max=None, wait_ms=None):
+    """`complaints` complaints from `concurrency` threads at once (a block
+    losing power), per-call connect + CALL + commit vs the group-commit queue.
+    handler=True times the whole raise_complaint, table refresh included."""
+    conn = hm.get_connection(); cur = conn.cursor()
+    cur.execute("SELECT Student_ID FROM Student ORDER BY Student_ID LIMIT %s", (complaints,))
+    student_ids = [r[0] for r in cur.fetchall()]
+    cur.close(); conn.close()
+    if not student_ids:
+        raise SystemExit("no students; run seed_hostel.py first")
+    if batch_max is not None:
+        hm.COMPLAINT_BATCH_MAX = batch_max
+    if wait_ms is not None:
+        hm.COMPLAINT_BATCH_WAIT_MS = wait_ms
+    saved = hm.COMPLAINT_WRITE_BEHIND
+    out = {"complaints": complaints, "concurrency": concurrency, "handler": handler,
+           "batch_max": hm.COMPLAINT_BATCH_MAX, "batch_wait_ms": hm.COMPLAINT_BATCH_WAIT_MS}
+    try:
+        for mode, write_behind in (("per_call", False), ("write_behind", True)):
+            hm.COMPLAINT_WRITE_BEHIND = write_behind
+            if handler:
+                write = hm.raise_complaint
+            else:
+                write = hm.submit_complaint if write_behind else hm._raise_complaint_direct
+
+            def one(i):
+                t0 = time.perf_counter()
+                result = write(student_ids[i % len(student_ids)], BURST_TEXT)
+                ok = not (handler and hm._is_error_result(result))
+                return time.perf_counter() - t0, ok
+
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(concurrency) as ex:
+                results = list(ex.map(one, range(complaints)))
+            elapsed = time.perf_counter() - t0
+            lat = sorted(x for x, _ in results)
+            out[mode] = {
+                "seconds": round(elapsed, 3),
+                "complaints_per_s": round(complaints / elapsed, 1),
+                "errors": sum(1 for _, ok in results if not ok),
+                "p50_ms": round(_percentile(lat, 0.50) * 1000, 2),
+                "p95_ms": round(_percentile(lat, 0.95) * 1000, 2),
+                "p99_ms": round(_percentile(lat, 0.99) * 1000, 2),
+            }
+            if write_behind:
+                out[mode]["queue"] = hm.complaint_queue_stats()
+        out["speedup"] = round(out["write_behind"]["complaints_per_s"] / out["per_call"]["complaints_per_s"], 2)
+    finally:
+        hm.COMPLAINT_WRITE_BEHIND = saved
+        if hm._complaint_queue is not None:
+            hm._complaint_queue.close()
+            hm._complaint_queue = None
+        conn = hm.get_connection(); cur = conn.cursor()
+        cur.execute("DELETE FROM Complaint WHERE Complaint_Text = %s", (BURST_TEXT,))
+        conn.commit()
+        cur.close(); conn.close()
+        hm.invalidate_reads()
+    return out
+
+
+LIVE_TEXT = "bench live: corridor light out"
+
+
+def _sql_count():
+    return sum(h.count for h in list(hm.metrics.sql_seconds.values()))
+
+
+def _live_round(viewers, writes, duration, interval, student_ids, naive):
+    """`viewers` sessions ticking every `interval` while one writer spreads
+    `writes` complaints (every 10th also moved to In Progress) over `duration`
+    seconds. Returns the statements executed and what the viewers saw."""
+    stop = threading.Event()
+    ticks, seen_last = [0] * viewers, [0] * viewers
+
+    def viewer(i):
+        seen = {}
+        while not stop.is_set():
+            if naive:
+                hm.dashboard_summary(); hm.view_complaints()
+            else:
+                seen, _ = hm.live_poll(seen)
+                seen_last[i] = seen.get("last_id", 0)
+            ticks[i] += 1
+            stop.wait(interval)
+
+    before = _sql_count()
+    threads = [threading.Thread(target=viewer, args=(i,), daemon=True) for i in range(viewers)]
+    for t in threads:
+        t.start()
+    last_id = 0
+    for n in range(writes):
+        hm.submit_complaint(student_ids[n % len(student_ids)], LIVE_TEXT)
+        if n % 10 == 9:
+            conn = hm.get_connection(); cur = conn.cursor()
+            cur.execute("SELECT MAX(Complaint_ID) FROM Complaint")
+            last_id = cur.fetchone()[0]
+            cur.close(); conn.close()
+            hm.transition_complaints("In Progress", complaint_ids=str(last_id))
+        time.sleep(duration / writes)
+    # one more interval for the last writes to reach the snapshot and the viewers
+    time.sleep(2 * interval + 0.1)
+    stop.set()
+    for t in threads:
+        t.join()
+    out = {"viewers": viewers, "queries": _sql_count() - before, "ticks": sum(ticks)}
+    if not naive:
+        out["caught_up"] = sum(1 for x in seen_last if x >= last_id)
+    return out
+
+
+def bench_live_viewers(viewer_counts, writes, duration, interval, naive_max=100):
+    """Statements executed while `writes` complaints arrive, per number of live
+    viewers, and how many viewers caught up with the newest complaint. The
+    naive rows are the same sessions re-running dashboard_summary +
+    view_complaints each tick with the read cache off. tests/test_live.py
+    asserts that the live count stays flat."""
+    conn = hm.get_connection(); cur = conn.cursor()
+    cur.execute("SELECT Student_ID FROM Student ORDER BY Student_ID LIMIT 100")
+    student_ids = [r[0] for r in cur.fetchall()]
+    cur.close(); conn.close()
+    if not student_ids:
+        raise SystemExit("no students; run seed_hostel.py first")
+    hm.LIVE_INTERVAL = interval
+    saved_ttl = hm.CACHE_TTL
+    out = {"writes": writes, "duration_s": duration, "interval_s": interval, "live": [], "naive": []}
+    try:
+        hm.get_live_feed().wait(0, 30)
+        events0 = hm.live_feed_stats()
+        for n in viewer_counts:
+            out["live"].append(_live_round(n, writes, duration, interval, student_ids, naive=False))
+        stats = hm.live_feed_stats()
+        out["feed"] = {k: stats[k] - events0[k] for k in ("events", "refreshes", "errors")}
+        hm.CACHE_TTL = 0
+        for n in viewer_counts:
+            if n <= naive_max:
+                out["naive"].append(_live_round(n, writes, duration, interval, student_ids, naive=True))
+    finally:
+        hm.CACHE_TTL = saved_ttl
+        conn = hm.get_connection(); cur = conn.cursor()
+        cur.execute("DELETE FROM Complaint WHERE Complaint_Text = %s", (LIVE_TEXT,))
+        conn.commit()
+        cur.close(); conn.close()
+        hm.invalidate_reads()
+    return out
+
+
+def _traced(fn, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        out = fn(*args)
+        elapsed = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return out, elapsed, peak
+
+
+def _materialized_csv(source, path):
+    sql, params = hm._export_query(source)
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        cur.execute(sql, params)
+        df = pd.DataFrame(cur.fetchall(), columns=[d[0] for d in cur.description])
+    finally:
+        cur.close(); conn.close()
+    df.to_csv(path, index=False)
+    return len(df)
+
+
+def bench_export(sources, formats, chunk_size):
+    """Streamed export vs fetchall + DataFrame.to_csv: wall time, rows/s and
+    peak Python heap (tracemalloc) per source on the current database."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for source in sources:
+            res = {}
+            for fmt in formats:
+                try:
+                    r, elapsed, peak = _traced(hm.export_rows, source, fmt,
+                                               os.path.join(tmp, f"{source}.{fmt}"), chunk_size)
+                except RuntimeError as e:
+                    res[fmt] = {"skipped": str(e)}
+                    continue
+                res[fmt] = {"rows": r["rows"], "bytes": r["bytes"], "elapsed_s": round(elapsed, 3),
+                            "rows_per_s": r["rows_per_s"], "peak_mib": round(peak / 2**20, 2)}
+            rows, elapsed, peak = _traced(_materialized_csv, source, os.path.join(tmp, f"{source}-df.csv"))
+            res["dataframe_csv"] = {"rows": rows, "elapsed_s": round(elapsed, 3),
+                                    "rows_per_s": round(rows / elapsed, 1) if elapsed else None,
+                                    "peak_mib": round(peak / 2**20, 2)}
+            results[source] = res
+    return results
+
+
+def _percentile(sorted_samples, q):
+    if not sorted_samples:
+        return None
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * q))]
+
+
+def _staff_actions(rng, student_ids, blocks, with_writes):
+    table = rng.choice(sorted(hm.ALLOWED_TABLES))
+    actions = [
+        ("dashboard_summary", hm.dashboard_summary, ()),
+        ("view_table", hm.view_table, (table,)),
+        ("view_table_page", hm.view_table_page, (table, 50, "", None, None, None, "first")),
+        ("view_complaints", hm.view_complaints, (None,)),
+        ("view_students_bulk", hm.view_students_bulk, (None, None, rng.choice(blocks))),
+    ]
+    if with_writes:
+        sid = rng.choice(student_ids)
+        actions += [
+            ("add_payment", hm.add_payment, (sid, 1, "UPI")),
+            ("raise_complaint", hm.raise_complaint, (sid, "load test")),
+        ]
+    return actions
+
+
+def _student_actions(rng, student_ids, blocks, with_writes):
+    sid = rng.choice(student_ids)
+    actions = [
+        ("dashboard_data", hm.dashboard_data, ()),
+        ("view_complaints", hm.view_complaints, (sid,)),
+        ("view_student_details", hm.view_student_details, (sid,)),
+        ("verify_user", hm.verify_user, (f"student{sid}", "x")),
+    ]
+    if with_writes:
+        actions.append(("raise_complaint", hm.raise_complaint, (sid, "load test")))
+    return actions
+
+
+def load_test(staff, students, duration, think_ms, with_writes, seed=7):
+    """N concurrent staff + student sessions calling the handlers directly
+    (the same functions the Gradio events run) for `duration` seconds."""
+    conn = hm.get_connection(); cur = conn.cursor()
+    cur.execute("SELECT Student_ID FROM Student ORDER BY Student_ID LIMIT 1000")
+    student_ids = [r[0] for r in cur.fetchall()] or [1]
+    cur.execute("SELECT DISTINCT Block_Name FROM Room WHERE Block_Name IS NOT NULL")
+    blocks = [r[0] for r in cur.fetchall()] or ["A"]
+    cur.close(); conn.close()
+
+    samples, errors = {}, {}
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def session(n, make_actions):
+        rng = random.Random(seed + n)
+        while time.perf_counter() < stop_at:
+            name, fn, args = rng.choice(make_actions(rng, student_ids, blocks, with_writes))
+            t0 = time.perf_counter()
+            try:
+                failed = hm._is_error_result(fn(*args))
+            except Exception:
+                failed = True
+            elapsed = time.perf_counter() - t0
+            with lock:
+                samples.setdefault(name, []).append(elapsed)
+                if failed:
+                    errors[name] = errors.get(name, 0) + 1
+            if think_ms:
+                time.sleep(rng.uniform(0, think_ms) / 1000)
+
+    with ThreadPoolExecutor(max_workers=staff + students) as pool:
+        for i in range(staff):
+            pool.submit(session, i, _staff_actions)
+        for i in range(students):
+            pool.submit(session, staff + i, _student_actions)
+
+    report = {}
+    for name, xs in sorted(samples.items()):
+        xs.sort()
+        report[name] = {
+            "calls": len(xs),
+            "errors": errors.get(name, 0),
+            "p50_ms": round(_percentile(xs, 0.50) * 1000, 2),
+            "p95_ms": round(_percentile(xs, 0.95) * 1000, 2),
+            "p99_ms": round(_percentile(xs, 0.99) * 1000, 2),
+        }
+    return {
+        "sessions": {"staff": staff, "students": students},
+        "duration_s": duration,
+        "throughput_rps": round(sum(len(x) for x in samples.values()) / duration, 1),
+        "handlers": report,
+        "pool": hm.pool_stats(),
+        "cache": hm.cache_stats(),
+    }
+
+
+# rooms, students, mean payments / complaints per student
+SUITE_SCALES = {
+    "small":  (200, 600, 2, 0.5),
+    "medium": (5_000, 15_000, 3, 1),
+    "large":  (20_000, 60_000, 4, 2),
+}
+
+
+def _suite_read_handlers(sid, block):
+    calls = [
+        ("get_total_students", hm.get_total_students, ()),
+        ("get_pending_fees", hm.get_pending_fees, ()),
+        ("get_total_rooms", hm.get_total_rooms, ()),
+        ("get_complaint_counts", hm.get_complaint_counts, ()),
+        ("get_students", hm.get_students, ()),
+        ("dashboard_summary", hm.dashboard_summary, ()),
+        ("dashboard_data", hm.dashboard_data, ()),
+        ("view_complaints(all)", hm.view_complaints, (None,)),
+        ("view_complaints(student)", hm.view_complaints, (sid,)),
+        ("search_complaints", hm.search_complaints, ("water leak",)),
+        ("view_student_details", hm.view_student_details, (sid,)),
+        ("view_students_bulk(block)", hm.view_students_bulk, (None, None, block)),
+        ("verify_user", hm.verify_user, ("bench-nobody", "x")),
+    ]
+    for t in sorted(hm.ALLOWED_TABLES):
+        calls.append((f"view_table({t})", hm.view_table, (t,)))
+        calls.append((f"estimate_table_rows({t})", hm.estimate_table_rows, (t,)))
+    return calls
+
+
+_INSERT_SQL = "INSERT INTO Student (Student_ID, Name, Gender, Department, Room_ID) VALUES (%s, %s, %s, %s, %s)"
+
+
+def _suite_trigger_paths(rounds):
+    """Write paths through the triggers, on throw-away rows above BENCH_ID_BASE."""
+    conn = hm.get_connection(); cur = conn.cursor()
+    results = {}
+    try:
+        rooms = _create_bench_rooms(cur, 2, capacity=rounds + 1)
+        conn.commit()
+        timings = {k: [] for k in ("insert_student", "move_room", "insert_payment",
+                                   "insert_complaint", "delete_student")}
+        for i in range(rounds):
+            sid = BENCH_ID_BASE + i
+            steps = (
+                ("insert_student", _INSERT_SQL, (sid, "Trigger Bench", "Other", "BENCH", rooms[0])),
+                ("move_room", "UPDATE Student SET Room_ID=%s WHERE Student_ID=%s", (rooms[1], sid)),
+                ("insert_payment", "INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Mode) "
+                                   "VALUES (%s, 1, 'Cash')", (sid,)),
+                ("insert_complaint", "INSERT INTO Complaint (Student_ID, Complaint_Text) "
+                                     "VALUES (%s, 'trigger bench')", (sid,)),
+            )
+            for name, sql, params in steps:
+                t0 = time.perf_counter()
+                cur.execute(sql, params); conn.commit()
+                timings[name].append(time.perf_counter() - t0)
+            cur.execute("DELETE FROM Complaint WHERE Student_ID=%s", (sid,))
+            cur.execute("DELETE FROM Fee_Payment WHERE Student_ID=%s", (sid,))
+            conn.commit()
+            t0 = time.perf_counter()
+            cur.execute("DELETE FROM Student WHERE Student_ID=%s", (sid,)); conn.commit()
+            timings["delete_student"].append(time.perf_counter() - t0)
+        for name, xs in timings.items():
+            xs.sort()
+            results[f"trigger:{name}"] = {
+                "rounds": rounds,
+                "mean_ms": round(statistics.mean(xs) * 1000, 3),
+                "p50_ms": round(_percentile(xs, 0.5) * 1000, 3),
+                "p95_ms": round(_percentile(xs, 0.95) * 1000, 3),
+            }
+    finally:
+        _cleanup_bench_rows(conn, cur)
+        cur.close(); conn.close()
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_suite(scales, rounds, reset, seed):
+    """Seed each scale, then time every public read handler and each trigger
+    path. The result cache is off so every call reaches the database."""
+    if not reset:
+        raise SystemExit("suite re-seeds the database for every scale; pass --reset to confirm")
+    saved_ttl, hm.CACHE_TTL = hm.CACHE_TTL, 0
+    out = {
+        "revision": _git_revision(),
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "backend": hm.DB_BACKEND,
+        "database": hm.SQLITE_PATH if hm.DB_BACKEND == "sqlite" else f"{hm.DB_HOST}/{hm.DB_NAME}",
+        "rounds": rounds,
+        "scales": {},
+    }
+    try:
+        for scale in scales:
+            rooms, students, payments, complaints = SUITE_SCALES[scale]
+            seeded = seed_hostel.generate(rooms, students, payments, complaints, seed=seed, reset=True)
+            hm.refresh_schema()
+            conn = hm.get_connection(); cur = conn.cursor()
+            cur.execute("SELECT MIN(Student_ID) FROM Student WHERE Room_ID IS NOT NULL")
+            sid = cur.fetchone()[0] or 1
+            cur.close(); conn.close()
+            handlers = {}
+            for name, fn, args in _suite_read_handlers(sid, seed_hostel.BLOCKS[0]):
+                fn(*args)
+                handlers[name] = _time_calls(fn, args, rounds)
+            handlers.update(_suite_trigger_paths(rounds))
+            out["scales"][scale] = {"seeded": seeded, "handlers": handlers}
+    finally:
+        hm.CACHE_TTL = saved_ttl
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=sorted(hm.BACKENDS), default=hm.DB_BACKEND,
+                        help="storage backend to benchmark (default: DB_BACKEND)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("pool", help="pooled vs per-call connect for the read handlers")
+    p.add_argument("--rounds", type=int, default=100)
+
+    p = sub.add_parser("details-fanout", help="view_student_details timing for a student with a long history")
+    p.add_argument("--payments", type=int, default=12)
+    p.add_argument("--complaints", type=int, default=10)
+    p.add_argument("--rounds", type=int, default=100)
+
+    p = sub.add_parser("import-time", help="python -X importtime of the data layer and its slowest imports")
+    p.add_argument("--rounds", type=int, default=5)
+
+    sub.add_parser("replicas", help="regression check for read/write routing (needs DB_REPLICAS)")
+
+    p = sub.add_parser("import-students", help="bulk CSV student import throughput")
+    p.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    p.add_argument("--chunk-size", type=int, default=hm.IMPORT_CHUNK_SIZE)
+
+    p = sub.add_parser("allocate", help="room allocation planner timing (in memory)")
+    p.add_argument("--rooms", type=int, default=5000)
+    p.add_argument("--students", type=int, default=20000)
+
+    p = sub.add_parser("reshuffle", help="bulk room moves with swaps and cycles (resets and seeds)")
+    p.add_argument("--moves", type=int, default=20_000)
+
+    p = sub.add_parser("load", help="concurrent staff/student sessions, p50/p95/p99 per handler")
+    p.add_argument("--staff", type=int, default=10)
+    p.add_argument("--students", type=int, default=50)
+    p.add_argument("--duration", type=float, default=30)
+    p.add_argument("--think-ms", type=float, default=200, help="max random pause between actions")
+    p.add_argument("--with-writes", action="store_true", help="include add_payment / raise_complaint")
+    p.add_argument("--no-cache", action="store_true", help="run with CACHE_TTL=0")
+
+    p = sub.add_parser("complaint-search", help="FULLTEXT vs LIKE '%%term%%' complaint search")
+    p.add_argument("--terms", nargs="+", default=list(SEARCH_TERMS))
+    p.add_argument("--rounds", type=int, default=20)
+    p.add_argument("--complaints", type=int, help="reset and seed this many complaints first")
+
+    p = sub.add_parser("reconcile", help="occupancy drift detection and fix timing (resets and seeds)")
+    p.add_argument("--rooms", type=int, default=10_000)
+    p.add_argument("--drift", type=float, default=0.05, help="share of rooms to knock out of sync")
+
+    p = sub.add_parser("fee-analytics", help="fee report: chunked full scan vs rollups (resets and seeds)")
+    p.add_argument("--payments", type=int, default=1_000_000)
+    p.add_argument("--students", type=int, help="default: payments / 10")
+    p.add_argument("--rounds", type=int, default=3)
+
+    p = sub.add_parser("complaint-burst", help="complaints/sec: per-call commit vs group-commit queue")
+    p.add_argument("--complaints", type=int, default=2000)
+    p.add_argument("--concurrency", type=int, default=50)
+    p.add_argument("--handler", action="store_true", help="time raise_complaint incl. the table refresh")
+    p.add_argument("--batch-max", type=int, help="override COMPLAINT_BATCH_MAX")
+    p.add_argument("--wait-ms", type=float, help="override COMPLAINT_BATCH_WAIT_MS")
+
+    p = sub.add_parser("live-viewers", help="statements executed as live viewers are added, live feed vs polling")
+    p.add_argument("--viewers", type=int, nargs="+", default=[1, 10, 100])
+    p.add_argument("--writes", type=int, default=200)
+    p.add_argument("--duration", type=float, default=10.0, help="seconds the writes are spread over")
+    p.add_argument("--interval", type=float, default=0.5, help="LIVE_INTERVAL / viewer tick for the run")
+
+    p = sub.add_parser("archive", help="complaint / details handlers before and after archiving past terms")
+    p.add_argument("--students", type=int, default=30_000)
+    p.add_argument("--payments", type=float, default=4.0, help="mean payments per student")
+    p.add_argument("--complaints", type=float, default=2.0, help="mean complaints per student")
+    p.add_argument("--days", type=int, default=730, help="history spread over this many days")
+    p.add_argument("--rounds", type=int, default=10)
+
+    p = sub.add_parser("export", help="streamed CSV / Parquet export vs a materialized DataFrame")
+    p.add_argument("--sources", nargs="+", default=["Fee_Payment", "Student"])
+    p.add_argument("--formats", nargs="+", choices=hm.EXPORT_FORMATS, default=list(hm.EXPORT_FORMATS))
+    p.add_argument("--chunk-size", type=int, default=hm.EXPORT_CHUNK_SIZE)
+
+    p = sub.add_parser("suite", help="seed each scale and time every handler and trigger path")
+    p.add_argument("--scales", nargs="+", choices=sorted(SUITE_SCALES), default=["small", "medium"])
+    p.add_argument("--rounds", type=int, default=20)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--reset", action="store_true", help="required: the suite TRUNCATEs the data tables")
+    p.add_argument("--out", help="also write the JSON results to this file")
+
+    args = parser.parse_args(argv)
+    hm.DB_BACKEND = args.backend
+    if args.cmd == "pool":
+        out = bench_pool(args.rounds)
+    elif args.cmd == "details-fanout":
+        out = bench_details_fanout(args.payments, args.complaints, args.rounds)
+    elif args.cmd == "import-time":
+        out = bench_import_time(args.rounds)
+    elif args.cmd == "replicas":
+        out = check_replica_routing()
+    elif args.cmd == "import-students":
+        out = bench_import_students(args.rows, args.chunk_size)
+    elif args.cmd == "allocate":
+        out = bench_allocate(args.rooms, args.students)
+    elif args.cmd == "reshuffle":
+        out = bench_reshuffle(args.moves)
+    elif args.cmd == "load":
+        if args.no_cache:
+            hm.CACHE_TTL = 0
+        out = load_test(args.staff, args.students, args.duration, args.think_ms, args.with_writes)
+    elif args.cmd == "complaint-search":
+        out = bench_complaint_search(args.terms, args.rounds, args.complaints)
+    elif args.cmd == "reconcile":
+        out = bench_reconcile(args.rooms, args.drift)
+    elif args.cmd == "fee-analytics":
+        out = bench_fee_analytics(args.payments, args.students, args.rounds)
+    elif args.cmd == "complaint-burst":
+        out = bench_complaint_burst(args.complaints, args.concurrency, args.handler,
+                                    args.batch_max, args.wait_ms)
+    elif args.cmd == "live-viewers":
+        out = bench_live_viewers(args.viewers, args.writes, args.duration, args.interval)
+    elif args.cmd == "archive":
+        out = bench_archive(args.students, args.payments, args.complaints, args.days, args.rounds)
+    elif args.cmd == "export":
+        out = bench_export(args.sources, args.formats, args.chunk_size)
+    elif args.cmd == "suite":
+        out = run_suite(args.scales, args.rounds, args.reset, args.seed)
+        if args.out:
+            with open(args.out, "w") as fh:
+                json.dump(out, fh, indent=2, default=str)
+    print(json.dumps(out, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -60,6 +60,8 @@ CREATE TABLE Complaint (
     Complaint_Text TEXT NOT NULL,
     Complaint_Date DATETIME DEFAULT CURRENT_TIMESTAMP,
     Status ENUM('Open', 'In Progress', 'Resolved') DEFAULT 'Open',
+    In_Progress_At DATETIME NULL,
+    Resolved_At DATETIME NULL,
     CONSTRAINT fk_compl_student FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID)
         ON UPDATE RESTRICT
         ON DELETE SET NULL
@@ -67,6 +69,13 @@ CREATE TABLE Complaint (
 
 CREATE INDEX idx_complaint_student ON Complaint(Student_ID);
 CREATE INDEX idx_complaint_status ON Complaint(Status);
+CREATE INDEX idx_complaint_date ON Complaint(Complaint_Date);
+-- Transition timestamps (transition_complaints) and aging window; existing databases:
+--   ALTER TABLE Complaint ADD COLUMN In_Progress_At DATETIME NULL, ADD COLUMN Resolved_At DATETIME NULL;
+--   CREATE INDEX idx_complaint_date ON Complaint(Complaint_Date);
+-- Ranked complaint search (search_complaints); existing databases:
+--   ALTER TABLE Complaint ADD FULLTEXT INDEX ft_complaint_text (Complaint_Text);
+CREATE FULLTEXT INDEX ft_complaint_text ON Complaint(Complaint_Text);
 
 -- ===========================================================
 --  TABLE: FEE_PAYMENT
@@ -78,6 +87,8 @@ CREATE TABLE Fee_Payment (
     Payment_Date DATE DEFAULT (CURRENT_DATE),
     Payment_Mode ENUM('Cash', 'Card', 'UPI', 'Bank Transfer'),
     Staff_ID INT,
+    Reference VARCHAR(64) NULL,   -- bank/UPI statement reference (dedupes re-uploads)
+    CONSTRAINT uq_fee_reference UNIQUE (Reference),
     CONSTRAINT fk_fee_student FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID)
         ON UPDATE RESTRICT
         ON DELETE SET NULL,
@@ -86,8 +97,103 @@ CREATE TABLE Fee_Payment (
         ON DELETE SET NULL
 ) ENGINE=InnoDB;
 
+-- Existing databases:
+--   ALTER TABLE Fee_Payment ADD COLUMN Reference VARCHAR(64) NULL,
+--     ADD CONSTRAINT uq_fee_reference UNIQUE (Reference);
+
 CREATE INDEX idx_fee_student ON Fee_Payment(Student_ID);
 CREATE INDEX idx_fee_staff ON Fee_Payment(Staff_ID);
+CREATE INDEX idx_fee_date ON Fee_Payment(Payment_Date);
+-- Archival by Payment_Date (archive_history); existing databases:
+--   CREATE INDEX idx_fee_date ON Fee_Payment(Payment_Date);
+--   and the two *_Archive tables below.
+
+-- ===========================================================
+--  ARCHIVE: resolved complaints and fee payments from past terms
+--  (moved by archive_history; same IDs and columns + Archived_At).
+--  No foreign keys: history outlives the student and room rows.
+-- ===========================================================
+CREATE TABLE Complaint_Archive (
+    Complaint_ID INT PRIMARY KEY,
+    Student_ID INT,
+    Complaint_Text TEXT NOT NULL,
+    Complaint_Date DATETIME,
+    Status ENUM('Open', 'In Progress', 'Resolved'),
+    In_Progress_At DATETIME NULL,
+    Resolved_At DATETIME NULL,
+    Archived_At DATETIME DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB;
+
+CREATE INDEX idx_complaint_archive_student ON Complaint_Archive(Student_ID);
+CREATE INDEX idx_complaint_archive_date ON Complaint_Archive(Complaint_Date);
+
+CREATE TABLE Fee_Payment_Archive (
+    Payment_ID INT PRIMARY KEY,
+    Student_ID INT,
+    Amount DECIMAL(10,2),
+    Payment_Date DATE,
+    Payment_Mode ENUM('Cash', 'Card', 'UPI', 'Bank Transfer'),
+    Staff_ID INT,
+    Reference VARCHAR(64) NULL,
+    Archived_At DATETIME DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_fee_archive_reference UNIQUE (Reference)
+) ENGINE=InnoDB;
+
+CREATE INDEX idx_fee_archive_student ON Fee_Payment_Archive(Student_ID);
+CREATE INDEX idx_fee_archive_date ON Fee_Payment_Archive(Payment_Date);
+
+-- ===========================================================
+--  FEE ROLLUPS (refresh_fee_rollups; read by fee_analytics)
+--  Payments summed per day / mode / department and per term /
+--  student, up to Fee_Rollup_State.Last_Payment_ID. Reports add
+--  only the payments after that watermark. Existing databases:
+--  run this block, then python Hostel_management.py fee-rollup.
+-- ===========================================================
+CREATE TABLE Fee_Daily_Rollup (
+    Roll_Date DATE NOT NULL,
+    Payment_Mode VARCHAR(20) NOT NULL,
+    Department VARCHAR(50) NOT NULL,
+    Payments INT NOT NULL DEFAULT 0,
+    Amount DECIMAL(14,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (Roll_Date, Payment_Mode, Department)
+) ENGINE=InnoDB;
+
+CREATE TABLE Fee_Student_Rollup (
+    Term_Start DATE NOT NULL,
+    Student_ID INT NOT NULL,
+    Payments INT NOT NULL DEFAULT 0,
+    Amount DECIMAL(14,2) NOT NULL DEFAULT 0,
+    Last_Payment DATE NULL,
+    PRIMARY KEY (Term_Start, Student_ID)
+) ENGINE=InnoDB;
+
+CREATE TABLE Fee_Rollup_State (
+    State_ID TINYINT PRIMARY KEY DEFAULT 1,
+    Last_Payment_ID INT NOT NULL DEFAULT 0,
+    Refreshed_At DATETIME NULL,
+    CONSTRAINT chk_fee_rollup_single_row CHECK (State_ID = 1)
+) ENGINE=InnoDB;
+
+INSERT INTO Fee_Rollup_State (State_ID) VALUES (1);
+
+-- ===========================================================
+--  TABLE: HOSTEL_SUMMARY  (single row of dashboard counters,
+--  kept current by the trg_summary_* triggers below)
+-- ===========================================================
+CREATE TABLE Hostel_Summary (
+    Summary_ID TINYINT PRIMARY KEY DEFAULT 1,
+    Total_Students INT NOT NULL DEFAULT 0,
+    Pending_Fees INT NOT NULL DEFAULT 0,
+    Total_Rooms INT NOT NULL DEFAULT 0,
+    Available_Rooms INT NOT NULL DEFAULT 0,
+    Free_Beds INT NOT NULL DEFAULT 0,
+    Open_Complaints INT NOT NULL DEFAULT 0,
+    In_Progress_Complaints INT NOT NULL DEFAULT 0,
+    Resolved_Complaints INT NOT NULL DEFAULT 0,
+    CONSTRAINT chk_summary_single_row CHECK (Summary_ID = 1)
+) ENGINE=InnoDB;
+
+INSERT INTO Hostel_Summary (Summary_ID) VALUES (1);
 
 -- ===========================================================
 --  FUNCTIONS
@@ -145,6 +251,25 @@ END;
 //
 DELIMITER ;
 
+-- Recompute the dashboard counters from scratch (reconciliation)
+DELIMITER //
+CREATE PROCEDURE RefreshHostelSummary()
+BEGIN
+    INSERT IGNORE INTO Hostel_Summary (Summary_ID) VALUES (1);
+    UPDATE Hostel_Summary SET
+        Total_Students = (SELECT COUNT(*) FROM Student),
+        Pending_Fees = (SELECT COUNT(*) FROM Student WHERE Fee_Status = 'Pending'),
+        Total_Rooms = (SELECT COUNT(*) FROM Room),
+        Available_Rooms = (SELECT COUNT(*) FROM Room WHERE Current_Occupancy < Capacity),
+        Free_Beds = (SELECT COALESCE(SUM(GREATEST(Capacity - Current_Occupancy, 0)), 0) FROM Room),
+        Open_Complaints = (SELECT COUNT(*) FROM Complaint WHERE Status = 'Open'),
+        In_Progress_Complaints = (SELECT COUNT(*) FROM Complaint WHERE Status = 'In Progress'),
+        Resolved_Complaints = (SELECT COUNT(*) FROM Complaint WHERE Status = 'Resolved')
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
 -- ===========================================================
 --  TRIGGERS
 --  Fee status auto-update on payment
@@ -154,20 +279,27 @@ CREATE TRIGGER trg_update_fee_status
 AFTER INSERT ON Fee_Payment
 FOR EACH ROW
 BEGIN
-    UPDATE Student
-    SET Fee_Status = 'Paid'
-    WHERE Student_ID = NEW.Student_ID;
+    -- bulk statement imports set Fee_Status once per student instead
+    IF COALESCE(@hostel_bulk_load, 0) = 0 THEN
+        UPDATE Student
+        SET Fee_Status = 'Paid'
+        WHERE Student_ID = NEW.Student_ID;
+    END IF;
 END;
 //
 DELIMITER ;
 
+-- Bulk loaders (Hostel_management.bulk_load_session) set @hostel_bulk_load = 1,
+-- check capacity for the whole chunk and update Current_Occupancy with one
+-- grouped statement, so the per-row occupancy triggers stand aside.
+
 -- 1) BEFORE INSERT: prevent assignment to full rooms
 DELIMITER //
 CREATE TRIGGER trg_room_before_insert_student
 BEFORE INSERT ON Student
 FOR EACH ROW
 BEGIN
-    IF NEW.Room_ID IS NOT NULL THEN
+    IF NEW.Room_ID IS NOT NULL AND COALESCE(@hostel_bulk_load, 0) = 0 THEN
         IF (SELECT Current_Occupancy FROM Room WHERE Room_ID = NEW.Room_ID) 
            >= (SELECT Capacity FROM Room WHERE Room_ID = NEW.Room_ID) THEN
             SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Room is full: cannot assign student.';
@@ -183,7 +315,7 @@ CREATE TRIGGER trg_room_after_insert_student
 AFTER INSERT ON Student
 FOR EACH ROW
 BEGIN
-    IF NEW.Room_ID IS NOT NULL THEN
+    IF NEW.Room_ID IS NOT NULL AND COALESCE(@hostel_bulk_load, 0) = 0 THEN
         UPDATE Room
         SET Current_Occupancy = Current_Occupancy + 1
         WHERE Room_ID = NEW.Room_ID;
@@ -197,18 +329,18 @@ DELIMITER //
 CREATE TRIGGER trg_room_before_update_student
 BEFORE UPDATE ON Student
 FOR EACH ROW
-BEGIN
+trg_body: BEGIN
     IF NEW.Room_ID IS NULL THEN
-        LEAVE trg_room_before_update_student;
+        LEAVE trg_body;
     END IF;
 
-    IF (OLD.Room_ID IS NULL OR NEW.Room_ID <> OLD.Room_ID) THEN
+    IF (OLD.Room_ID IS NULL OR NEW.Room_ID <> OLD.Room_ID) AND COALESCE(@hostel_bulk_load, 0) = 0 THEN
         IF (SELECT Current_Occupancy FROM Room WHERE Room_ID = NEW.Room_ID) 
            >= (SELECT Capacity FROM Room WHERE Room_ID = NEW.Room_ID) THEN
             SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Target room is full: cannot move student.';
         END IF;
     END IF;
-END;
+END trg_body;
 //
 DELIMITER ;
 
@@ -217,7 +349,12 @@ DELIMITER //
 CREATE TRIGGER trg_room_after_update_student
 AFTER UPDATE ON Student
 FOR EACH ROW
-BEGIN
+trg_body: BEGIN
+    -- bulk allocation / moves apply occupancy deltas set-based
+    IF COALESCE(@hostel_bulk_load, 0) = 1 THEN
+        LEAVE trg_body;
+    END IF;
+
     IF (OLD.Room_ID IS NOT NULL AND NEW.Room_ID IS NULL) THEN
         -- moved out of room: decrement old
         UPDATE Room
@@ -240,7 +377,7 @@ BEGIN
         SET Current_Occupancy = Current_Occupancy + 1
         WHERE Room_ID = NEW.Room_ID;
     END IF;
-END;
+END trg_body;
 //
 DELIMITER ;
 
@@ -260,6 +397,145 @@ END;
 //
 DELIMITER ;
 
+-- ===========================================================
+--  SUMMARY COUNTER TRIGGERS (feed Hostel_Summary)
+-- ===========================================================
+DELIMITER //
+CREATE TRIGGER trg_summary_after_insert_student
+AFTER INSERT ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Students = Total_Students + 1,
+        Pending_Fees = Pending_Fees + IF(NEW.Fee_Status = 'Pending', 1, 0)
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_update_student
+AFTER UPDATE ON Student
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Fee_Status <=> NEW.Fee_Status) THEN
+        UPDATE Hostel_Summary
+        SET Pending_Fees = Pending_Fees
+            + IF(NEW.Fee_Status = 'Pending', 1, 0) - IF(OLD.Fee_Status = 'Pending', 1, 0)
+        WHERE Summary_ID = 1;
+    END IF;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_delete_student
+AFTER DELETE ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Students = Total_Students - 1,
+        Pending_Fees = Pending_Fees - IF(OLD.Fee_Status = 'Pending', 1, 0)
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_insert_room
+AFTER INSERT ON Room
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Rooms = Total_Rooms + 1,
+        Available_Rooms = Available_Rooms + IF(NEW.Current_Occupancy < NEW.Capacity, 1, 0),
+        Free_Beds = Free_Beds + GREATEST(NEW.Capacity - NEW.Current_Occupancy, 0)
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
+-- Fires for every occupancy change made by the trg_room_* Student triggers
+DELIMITER //
+CREATE TRIGGER trg_summary_after_update_room
+AFTER UPDATE ON Room
+FOR EACH ROW
+BEGIN
+    IF OLD.Current_Occupancy <> NEW.Current_Occupancy OR OLD.Capacity <> NEW.Capacity THEN
+        UPDATE Hostel_Summary
+        SET Available_Rooms = Available_Rooms
+                + IF(NEW.Current_Occupancy < NEW.Capacity, 1, 0)
+                - IF(OLD.Current_Occupancy < OLD.Capacity, 1, 0),
+            Free_Beds = Free_Beds
+                + GREATEST(NEW.Capacity - NEW.Current_Occupancy, 0)
+                - GREATEST(OLD.Capacity - OLD.Current_Occupancy, 0)
+        WHERE Summary_ID = 1;
+    END IF;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_delete_room
+AFTER DELETE ON Room
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Rooms = Total_Rooms - 1,
+        Available_Rooms = Available_Rooms - IF(OLD.Current_Occupancy < OLD.Capacity, 1, 0),
+        Free_Beds = Free_Beds - GREATEST(OLD.Capacity - OLD.Current_Occupancy, 0)
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_insert_complaint
+AFTER INSERT ON Complaint
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Open_Complaints = Open_Complaints + IF(NEW.Status = 'Open', 1, 0),
+        In_Progress_Complaints = In_Progress_Complaints + IF(NEW.Status = 'In Progress', 1, 0),
+        Resolved_Complaints = Resolved_Complaints + IF(NEW.Status = 'Resolved', 1, 0)
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_update_complaint
+AFTER UPDATE ON Complaint
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Status <=> NEW.Status) THEN
+        UPDATE Hostel_Summary
+        SET Open_Complaints = Open_Complaints
+                + IF(NEW.Status = 'Open', 1, 0) - IF(OLD.Status = 'Open', 1, 0),
+            In_Progress_Complaints = In_Progress_Complaints
+                + IF(NEW.Status = 'In Progress', 1, 0) - IF(OLD.Status = 'In Progress', 1, 0),
+            Resolved_Complaints = Resolved_Complaints
+                + IF(NEW.Status = 'Resolved', 1, 0) - IF(OLD.Status = 'Resolved', 1, 0)
+        WHERE Summary_ID = 1;
+    END IF;
+END;
+//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_summary_after_delete_complaint
+AFTER DELETE ON Complaint
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Open_Complaints = Open_Complaints - IF(OLD.Status = 'Open', 1, 0),
+        In_Progress_Complaints = In_Progress_Complaints - IF(OLD.Status = 'In Progress', 1, 0),
+        Resolved_Complaints = Resolved_Complaints - IF(OLD.Status = 'Resolved', 1, 0)
+    WHERE Summary_ID = 1;
+END;
+//
+DELIMITER ;
+
 -- ===========================================================
 --  SAMPLE DATA (Rooms start with occupancy = 0)
 -- ===========================================================
@@ -304,6 +580,9 @@ SELECT Student_ID, Name, Fee_Status FROM Student ORDER BY Student_ID;
 SELECT GetRoomOccupancy(1) AS Occ_Room_1;
 SELECT CalculatePendingFees() AS Pending_Fees_Count;
 
+-- Dashboard counters should match the base tables
+SELECT * FROM Hostel_Summary;
+
 -- Procedure checks
 CALL ViewStudentDetails(1);
 CALL RaiseComplaint(2, 'Leaking faucet in bathroom');
\ No newline at end of file
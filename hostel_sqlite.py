@@ -0,0 +1,340 @@
+"""Embedded SQLite storage for Hostel_management (DB_BACKEND=sqlite).
+
+connect() returns a connection that looks like a mysql.connector one to the
+handlers: %s placeholders, cursor(dictionary=True), CALL for the stored
+procedures, SET @hostel_bulk_load for the trigger bypass, and errors raised
+as mysql.connector errors with the MySQL errno the handlers already test
+(1054, 1062, 1191, 1644 ...). The schema and triggers are in
+hostel_sqlite.sql and are applied to an empty database file on first use.
+"""
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from mysql.connector import errorcode, errors
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hostel_sqlite.sql")
+_schema_lock = threading.Lock()
+
+# stored procedures of hostel.sql, as statements with ? for the IN params
+PROCEDURES = {
+    "RaiseComplaint": [
+        "INSERT INTO Complaint (Student_ID, Complaint_Text) VALUES (?, ?)",
+    ],
+    "RefreshHostelSummary": [
+        "INSERT OR IGNORE INTO Hostel_Summary (Summary_ID) VALUES (1)",
+        "UPDATE Hostel_Summary SET "
+        "Total_Students = (SELECT COUNT(*) FROM Student), "
+        "Pending_Fees = (SELECT COUNT(*) FROM Student WHERE Fee_Status = 'Pending'), "
+        "Total_Rooms = (SELECT COUNT(*) FROM Room), "
+        "Available_Rooms = (SELECT COUNT(*) FROM Room WHERE Current_Occupancy < Capacity), "
+        "Free_Beds = (SELECT COALESCE(SUM(MAX(Capacity - Current_Occupancy, 0)), 0) FROM Room), "
+        "Open_Complaints = (SELECT COUNT(*) FROM Complaint WHERE Status = 'Open'), "
+        "In_Progress_Complaints = (SELECT COUNT(*) FROM Complaint WHERE Status = 'In Progress'), "
+        "Resolved_Complaints = (SELECT COUNT(*) FROM Complaint WHERE Status = 'Resolved') "
+        "WHERE Summary_ID = 1",
+    ],
+    "ViewStudentDetails": [
+        "SELECT s.Student_ID, s.Name, s.Department, s.Fee_Status, r.Room_No, r.Block_Name "
+        "FROM Student s LEFT JOIN Room r ON s.Room_ID = r.Room_ID WHERE s.Student_ID = ?",
+    ],
+}
+
+# -----------------------------------------------------------------------------
+# value conversion (DATE / DATETIME / DECIMAL come back typed, as from MySQL)
+# -----------------------------------------------------------------------------
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda v: v.strftime("%Y-%m-%d %H:%M:%S"))
+sqlite3.register_converter("DATE", lambda b: date.fromisoformat(b.decode()[:10]))
+sqlite3.register_converter("DATETIME", lambda b: datetime.fromisoformat(b.decode()))
+sqlite3.register_converter("DECIMAL", lambda b: Decimal(b.decode()))
+
+# -----------------------------------------------------------------------------
+# MySQL functions used by the handlers' SQL
+# -----------------------------------------------------------------------------
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _parse_dt(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    s = str(value)
+    return datetime.fromisoformat(s) if len(s) > 10 else datetime.combine(date.fromisoformat(s), datetime.min.time())
+
+_UNITS = {"SECOND": 1, "MINUTE": 60, "HOUR": 3600, "DAY": 86400}
+
+def _timestampdiff(unit, a, b):
+    a, b = _parse_dt(a), _parse_dt(b)
+    if a is None or b is None:
+        return None
+    return int((b - a).total_seconds() // _UNITS[unit.upper()])
+
+def _date_add(value, amount, unit):
+    # MySQL keeps DATE + INTERVAL n DAY a date
+    if value is None or amount is None:
+        return None
+    is_date = len(str(value)) <= 10 and unit.upper() == "DAY"
+    out = _parse_dt(value) + timedelta(seconds=float(amount) * _UNITS[unit.upper()])
+    return out.date().isoformat() if is_date else out.strftime("%Y-%m-%d %H:%M:%S")
+
+def _greatest(*args):
+    return None if any(a is None for a in args) else max(args)
+
+def _least(*args):
+    return None if any(a is None for a in args) else min(args)
+
+def _field(value, *options):
+    return next((i for i, o in enumerate(options, 1) if o == value), 0)
+
+def _if(cond, a, b):
+    return a if cond else b
+
+def _mod(a, b):
+    return None if a is None or not b else a % b
+
+def _register_functions(conn, state):
+    conn.create_function("hostel_bulk_load", 0, lambda: state["bulk_load"])
+    conn.create_function("NOW", 0, _now)
+    conn.create_function("CURDATE", 0, lambda: date.today().isoformat())
+    conn.create_function("TIMESTAMPDIFF", 3, _timestampdiff, deterministic=True)
+    conn.create_function("DATE_ADD", 3, _date_add, deterministic=True)
+    conn.create_function("GREATEST", -1, _greatest, deterministic=True)
+    conn.create_function("LEAST", -1, _least, deterministic=True)
+    conn.create_function("FIELD", -1, _field, deterministic=True)
+    conn.create_function("IF", 3, _if, deterministic=True)
+    conn.create_function("MOD", 2, _mod, deterministic=True)
+
+# -----------------------------------------------------------------------------
+# SQL translation
+# -----------------------------------------------------------------------------
+_CALL = re.compile(r"^\s*CALL\s+(\w+)\s*\((.*)\)\s*;?\s*$", re.I | re.S)
+_SET_BULK = re.compile(r"^\s*SET\s+@hostel_bulk_load\s*=\s*(\w+)\s*$", re.I)
+_SET_FK = re.compile(r"^\s*SET\s+FOREIGN_KEY_CHECKS\s*=\s*(\d)\s*$", re.I)
+_TRUNCATE = re.compile(r"^\s*TRUNCATE\s+TABLE\s+", re.I)
+_FOR_UPDATE = re.compile(r"\s+FOR\s+UPDATE\s*$", re.I)
+_TSDIFF = re.compile(r"TIMESTAMPDIFF\(\s*(\w+)\s*,", re.I)
+_INTERVAL = re.compile(r"(NOW\(\)|%s|\?)\s*([+-])\s*INTERVAL\s+(%s|\?|\d+)\s+(SECOND|MINUTE|HOUR|DAY)\b", re.I)
+_FULLTEXT = re.compile(r"\bMATCH\s*\(.*?\)\s*AGAINST\b", re.I | re.S)
+_INSERT_IGNORE = re.compile(r"^\s*INSERT\s+IGNORE\b", re.I)
+_ON_DUPLICATE = re.compile(r"\bAS\s+(\w+)\s+ON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.I)
+
+_translated = {}
+
+def translate(sql):
+    """MySQL statement -> SQLite statement (cached per statement text)."""
+    out = _translated.get(sql)
+    if out is None:
+        out = _INSERT_IGNORE.sub("INSERT OR IGNORE", sql)
+        m = _ON_DUPLICATE.search(out)
+        if m:
+            # upsert: the row alias in the update list is the row being inserted
+            alias = re.compile(rf"\b{m.group(1)}\.(\w+)")
+            out = out[:m.start()] + "ON CONFLICT DO UPDATE SET" + alias.sub(r"excluded.\1", out[m.end():])
+        out = _TSDIFF.sub(lambda m: f"TIMESTAMPDIFF('{m.group(1).upper()}',", out)
+        out = _INTERVAL.sub(lambda m: f"DATE_ADD({m.group(1)}, {m.group(2)}{m.group(3)}, '{m.group(4).upper()}')", out)
+        out = out.replace("`", '"').replace("%s", "?")
+        if len(_translated) < 4096:
+            _translated[sql] = out
+    return out
+
+def _map_error(e):
+    msg = str(e)
+    if isinstance(e, sqlite3.IntegrityError):
+        if msg.startswith("UNIQUE constraint failed"):
+            return errors.IntegrityError(msg=msg, errno=errorcode.ER_DUP_ENTRY, sqlstate="23000")
+        if msg.startswith("FOREIGN KEY constraint failed"):
+            return errors.IntegrityError(msg=msg, errno=errorcode.ER_NO_REFERENCED_ROW_2, sqlstate="23000")
+        if msg.startswith("CHECK constraint failed"):
+            return errors.DatabaseError(msg=msg, errno=errorcode.ER_CHECK_CONSTRAINT_VIOLATED, sqlstate="HY000")
+        if msg.startswith("NOT NULL constraint failed"):
+            return errors.IntegrityError(msg=msg, errno=errorcode.ER_BAD_NULL_ERROR, sqlstate="23000")
+        # RAISE(ABORT, ...) in a trigger, i.e. SIGNAL SQLSTATE '45000'
+        return errors.DatabaseError(msg=msg, errno=errorcode.ER_SIGNAL_EXCEPTION, sqlstate="45000")
+    if isinstance(e, sqlite3.OperationalError):
+        if msg.startswith("no such column"):
+            return errors.ProgrammingError(msg=msg, errno=errorcode.ER_BAD_FIELD_ERROR, sqlstate="42S22")
+        if msg.startswith("no such table"):
+            return errors.ProgrammingError(msg=msg, errno=errorcode.ER_NO_SUCH_TABLE, sqlstate="42S02")
+        if "locked" in msg or "busy" in msg:
+            return errors.DatabaseError(msg=msg, errno=errorcode.ER_LOCK_WAIT_TIMEOUT, sqlstate="HY000")
+        return errors.ProgrammingError(msg=msg, errno=errorcode.ER_PARSE_ERROR, sqlstate="42000")
+    return errors.DatabaseError(msg=msg)
+
+# -----------------------------------------------------------------------------
+# connection / cursor
+# -----------------------------------------------------------------------------
+class SQLiteCursor:
+    def __init__(self, conn, dictionary=False):
+        self._conn = conn
+        self._cur = conn._db.cursor()
+        self._dictionary = dictionary
+        self._rows = None          # result of a CALL
+
+    @property
+    def description(self):
+        if self._rows is not None:
+            return self._rows[0]
+        return self._cur.description
+
+    @property
+    def rowcount(self):
+        return self._cur.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cur.lastrowid
+
+    def _shape(self, rows):
+        if not self._dictionary or not rows:
+            return rows
+        names = [d[0] for d in self.description]
+        return [dict(zip(names, r)) for r in rows]
+
+    def execute(self, sql, params=None):
+        self._rows = None
+        params = tuple(params or ())
+        try:
+            if self._special(sql, params):
+                return
+            if _FULLTEXT.search(sql):
+                raise errors.ProgrammingError(msg="Can't find FULLTEXT index matching the column list",
+                                              errno=errorcode.ER_FT_MATCHING_KEY_NOT_FOUND, sqlstate="HY000")
+            if _FOR_UPDATE.search(sql):
+                # closest thing to row locks: take the write lock up front
+                sql = _FOR_UPDATE.sub("", sql)
+                if not self._conn._db.in_transaction:
+                    self._cur.execute("BEGIN IMMEDIATE")
+            self._cur.execute(translate(sql), params)
+        except sqlite3.Error as e:
+            raise _map_error(e) from e
+
+    def executemany(self, sql, seq_params):
+        self._rows = None
+        try:
+            self._cur.executemany(translate(sql), [tuple(p) for p in seq_params])
+        except sqlite3.Error as e:
+            raise _map_error(e) from e
+
+    def _special(self, sql, params):
+        m = _SET_BULK.match(sql)
+        if m:
+            self._conn._state["bulk_load"] = 0 if m.group(1).upper() in ("NULL", "0") else 1
+            return True
+        m = _SET_FK.match(sql)
+        if m:
+            self._cur.execute(f"PRAGMA foreign_keys = {'ON' if m.group(1) == '1' else 'OFF'}")
+            return True
+        if _TRUNCATE.match(sql):
+            self._cur.execute(translate(_TRUNCATE.sub("DELETE FROM ", sql)))
+            return True
+        m = _CALL.match(sql)
+        if m:
+            args = list(params)
+            if not args and m.group(2).strip():
+                raise errors.ProgrammingError(msg="CALL arguments must be passed as parameters")
+            self.callproc(m.group(1), args)
+            return True
+        return False
+
+    def callproc(self, procname, args=()):
+        statements = PROCEDURES.get(procname)
+        if statements is None:
+            raise errors.ProgrammingError(msg=f"PROCEDURE {procname} does not exist",
+                                          errno=errorcode.ER_SP_DOES_NOT_EXIST, sqlstate="42000")
+        args = list(args)
+        for stmt in statements:
+            n = stmt.count("?")
+            self._cur.execute(stmt, args[:n])
+            if self._cur.description:
+                self._rows = (self._cur.description, self._cur.fetchall())
+        return args
+
+    def fetchone(self):
+        if self._rows is not None:
+            rows = self._rows[1][:1]
+            self._rows = (self._rows[0], self._rows[1][1:])
+            return self._shape(rows)[0] if rows else None
+        row = self._cur.fetchone()
+        return self._shape([row])[0] if row is not None else None
+
+    def fetchmany(self, size=1):
+        if self._rows is not None:
+            rows, rest = self._rows[1][:size], self._rows[1][size:]
+            self._rows = (self._rows[0], rest)
+            return self._shape(rows)
+        return self._shape(self._cur.fetchmany(size))
+
+    def fetchall(self):
+        if self._rows is not None:
+            rows = self._rows[1]
+            self._rows = (self._rows[0], [])
+            return self._shape(rows)
+        return self._shape(self._cur.fetchall())
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        self._cur.close()
+
+class SQLiteConnection:
+    def __init__(self, db):
+        self._db = db
+        self._state = {"bulk_load": 0}
+        _register_functions(db, self._state)
+
+    @property
+    def in_transaction(self):
+        return self._db.in_transaction
+
+    def cursor(self, dictionary=False, buffered=None, **_):
+        # everything is in-process; buffered / unbuffered makes no difference
+        return SQLiteCursor(self, dictionary=dictionary)
+
+    def commit(self):
+        self._db.commit()
+
+    def rollback(self):
+        self._db.rollback()
+
+    def start_transaction(self):
+        self._db.execute("BEGIN")
+
+    def is_connected(self):
+        try:
+            self._db.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def ping(self, reconnect=False, **_):
+        if not self.is_connected():
+            raise errors.InterfaceError(msg="SQLite connection is closed")
+
+    def close(self):
+        self._db.close()
+
+def _apply_schema(db):
+    with _schema_lock:
+        if db.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='Room'").fetchone():
+            return
+        with open(SCHEMA_PATH, encoding="utf-8") as fh:
+            db.executescript(fh.read())
+        db.commit()
+
+def connect(path, timeout=30.0):
+    """Open (and on first use, create) the embedded database at `path`."""
+    db = sqlite3.connect(path, timeout=timeout, detect_types=sqlite3.PARSE_DECLTYPES,
+                         check_same_thread=False)
+    conn = SQLiteConnection(db)
+    db.execute("PRAGMA foreign_keys = ON")
+    if path != ":memory:":
+        db.execute("PRAGMA journal_mode = WAL")
+        db.execute("PRAGMA synchronous = NORMAL")
+    _apply_schema(db)
+    return conn
+
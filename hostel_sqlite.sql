@@ -0,0 +1,379 @@
+-- ===========================================================
+--  EMBEDDED (SQLite) SCHEMA — mirrors hostel.sql for DB_BACKEND=sqlite
+--  Applied automatically by hostel_sqlite.connect() on an empty file.
+--  ENUMs become CHECK constraints, stored procedures live in
+--  hostel_sqlite.PROCEDURES, and the triggers read the per-connection
+--  bulk-load flag through hostel_bulk_load() instead of @hostel_bulk_load.
+-- ===========================================================
+
+-- ===========================================================
+--  TABLE: STAFF
+-- ===========================================================
+CREATE TABLE Staff (
+    Staff_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Staff_Name VARCHAR(100) NOT NULL,
+    Role VARCHAR(20) DEFAULT 'Other'
+        CHECK (Role IN ('Warden', 'Accountant', 'Cleaner', 'Security', 'Other')),
+    Contact_Number VARCHAR(15),
+    Email VARCHAR(100) UNIQUE,
+    Joining_Date DATE DEFAULT (date('now', 'localtime')),
+    Salary DECIMAL(10,2) DEFAULT 0.00
+);
+
+-- ===========================================================
+--  TABLE: ROOM
+-- ===========================================================
+CREATE TABLE Room (
+    Room_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Block_Name VARCHAR(10),
+    Room_No VARCHAR(10),
+    Capacity INT NOT NULL,
+    Current_Occupancy INT NOT NULL DEFAULT 0,
+    CONSTRAINT chk_room_occ_bounds CHECK (
+        Current_Occupancy >= 0 AND Current_Occupancy <= Capacity
+    )
+);
+
+CREATE INDEX idx_room_block_no ON Room(Block_Name, Room_No);
+
+-- ===========================================================
+--  TABLE: STUDENT
+-- ===========================================================
+CREATE TABLE Student (
+    Student_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Name VARCHAR(100) NOT NULL,
+    Gender VARCHAR(10) NOT NULL CHECK (Gender IN ('Male', 'Female', 'Other')),
+    Department VARCHAR(50),
+    Room_ID INT NULL,
+    Fee_Status VARCHAR(10) DEFAULT 'Pending' CHECK (Fee_Status IN ('Paid', 'Pending')),
+    CONSTRAINT fk_room FOREIGN KEY (Room_ID) REFERENCES Room(Room_ID)
+        ON UPDATE RESTRICT
+        ON DELETE SET NULL
+);
+
+CREATE INDEX idx_student_room ON Student(Room_ID);
+CREATE INDEX idx_student_fee ON Student(Fee_Status);
+
+-- ===========================================================
+--  TABLE: COMPLAINT
+-- ===========================================================
+CREATE TABLE Complaint (
+    Complaint_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Student_ID INT,
+    Complaint_Text TEXT NOT NULL,
+    Complaint_Date DATETIME DEFAULT (datetime('now', 'localtime')),
+    Status VARCHAR(12) DEFAULT 'Open' CHECK (Status IN ('Open', 'In Progress', 'Resolved')),
+    In_Progress_At DATETIME NULL,
+    Resolved_At DATETIME NULL,
+    CONSTRAINT fk_compl_student FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID)
+        ON UPDATE RESTRICT
+        ON DELETE SET NULL
+);
+
+CREATE INDEX idx_complaint_student ON Complaint(Student_ID);
+CREATE INDEX idx_complaint_status ON Complaint(Status);
+CREATE INDEX idx_complaint_date ON Complaint(Complaint_Date);
+-- no FULLTEXT: search_complaints falls back to LIKE
+
+-- ===========================================================
+--  TABLE: FEE_PAYMENT
+-- ===========================================================
+CREATE TABLE Fee_Payment (
+    Payment_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Student_ID INT,
+    Amount DECIMAL(10,2),
+    Payment_Date DATE DEFAULT (date('now', 'localtime')),
+    Payment_Mode VARCHAR(20) CHECK (Payment_Mode IN ('Cash', 'Card', 'UPI', 'Bank Transfer')),
+    Staff_ID INT,
+    Reference VARCHAR(64) NULL,
+    CONSTRAINT uq_fee_reference UNIQUE (Reference),
+    CONSTRAINT fk_fee_student FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID)
+        ON UPDATE RESTRICT
+        ON DELETE SET NULL,
+    CONSTRAINT fk_fee_staff FOREIGN KEY (Staff_ID) REFERENCES Staff(Staff_ID)
+        ON UPDATE RESTRICT
+        ON DELETE SET NULL
+);
+
+CREATE INDEX idx_fee_student ON Fee_Payment(Student_ID);
+CREATE INDEX idx_fee_staff ON Fee_Payment(Staff_ID);
+CREATE INDEX idx_fee_date ON Fee_Payment(Payment_Date);
+
+-- ===========================================================
+--  ARCHIVE: resolved complaints and fee payments from past terms
+--  (moved by archive_history; same IDs and columns + Archived_At).
+--  No foreign keys: history outlives the student and room rows.
+-- ===========================================================
+CREATE TABLE Complaint_Archive (
+    Complaint_ID INT PRIMARY KEY,
+    Student_ID INT,
+    Complaint_Text TEXT NOT NULL,
+    Complaint_Date DATETIME,
+    Status VARCHAR(12),
+    In_Progress_At DATETIME NULL,
+    Resolved_At DATETIME NULL,
+    Archived_At DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE INDEX idx_complaint_archive_student ON Complaint_Archive(Student_ID);
+CREATE INDEX idx_complaint_archive_date ON Complaint_Archive(Complaint_Date);
+
+CREATE TABLE Fee_Payment_Archive (
+    Payment_ID INT PRIMARY KEY,
+    Student_ID INT,
+    Amount DECIMAL(10,2),
+    Payment_Date DATE,
+    Payment_Mode VARCHAR(20),
+    Staff_ID INT,
+    Reference VARCHAR(64) NULL,
+    Archived_At DATETIME DEFAULT (datetime('now', 'localtime')),
+    CONSTRAINT uq_fee_archive_reference UNIQUE (Reference)
+);
+
+CREATE INDEX idx_fee_archive_student ON Fee_Payment_Archive(Student_ID);
+CREATE INDEX idx_fee_archive_date ON Fee_Payment_Archive(Payment_Date);
+
+-- ===========================================================
+--  FEE ROLLUPS (refresh_fee_rollups; read by fee_analytics)
+-- ===========================================================
+CREATE TABLE Fee_Daily_Rollup (
+    Roll_Date DATE NOT NULL,
+    Payment_Mode VARCHAR(20) NOT NULL,
+    Department VARCHAR(50) NOT NULL,
+    Payments INT NOT NULL DEFAULT 0,
+    Amount DECIMAL(14,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (Roll_Date, Payment_Mode, Department)
+);
+
+CREATE TABLE Fee_Student_Rollup (
+    Term_Start DATE NOT NULL,
+    Student_ID INT NOT NULL,
+    Payments INT NOT NULL DEFAULT 0,
+    Amount DECIMAL(14,2) NOT NULL DEFAULT 0,
+    Last_Payment DATE NULL,
+    PRIMARY KEY (Term_Start, Student_ID)
+);
+
+CREATE TABLE Fee_Rollup_State (
+    State_ID TINYINT PRIMARY KEY DEFAULT 1,
+    Last_Payment_ID INT NOT NULL DEFAULT 0,
+    Refreshed_At DATETIME NULL,
+    CONSTRAINT chk_fee_rollup_single_row CHECK (State_ID = 1)
+);
+
+INSERT INTO Fee_Rollup_State (State_ID) VALUES (1);
+
+-- ===========================================================
+--  TABLE: USER_LOGIN
+-- ===========================================================
+CREATE TABLE User_Login (
+    Username VARCHAR(50) PRIMARY KEY,
+    Password VARCHAR(100) NOT NULL,
+    Role VARCHAR(20) NOT NULL,
+    Linked_ID INT NULL
+);
+
+-- ===========================================================
+--  TABLE: HOSTEL_SUMMARY
+-- ===========================================================
+CREATE TABLE Hostel_Summary (
+    Summary_ID TINYINT PRIMARY KEY DEFAULT 1,
+    Total_Students INT NOT NULL DEFAULT 0,
+    Pending_Fees INT NOT NULL DEFAULT 0,
+    Total_Rooms INT NOT NULL DEFAULT 0,
+    Available_Rooms INT NOT NULL DEFAULT 0,
+    Free_Beds INT NOT NULL DEFAULT 0,
+    Open_Complaints INT NOT NULL DEFAULT 0,
+    In_Progress_Complaints INT NOT NULL DEFAULT 0,
+    Resolved_Complaints INT NOT NULL DEFAULT 0,
+    CONSTRAINT chk_summary_single_row CHECK (Summary_ID = 1)
+);
+
+INSERT INTO Hostel_Summary (Summary_ID) VALUES (1);
+
+-- ===========================================================
+--  TRIGGERS (same semantics as hostel.sql)
+-- ===========================================================
+CREATE TRIGGER trg_update_fee_status
+AFTER INSERT ON Fee_Payment
+FOR EACH ROW WHEN hostel_bulk_load() = 0
+BEGIN
+    UPDATE Student SET Fee_Status = 'Paid' WHERE Student_ID = NEW.Student_ID;
+END;
+
+CREATE TRIGGER trg_room_before_insert_student
+BEFORE INSERT ON Student
+FOR EACH ROW WHEN NEW.Room_ID IS NOT NULL AND hostel_bulk_load() = 0
+BEGIN
+    SELECT RAISE(ABORT, 'Room is full: cannot assign student.')
+    FROM Room WHERE Room_ID = NEW.Room_ID AND Current_Occupancy >= Capacity;
+END;
+
+CREATE TRIGGER trg_room_after_insert_student
+AFTER INSERT ON Student
+FOR EACH ROW WHEN NEW.Room_ID IS NOT NULL AND hostel_bulk_load() = 0
+BEGIN
+    UPDATE Room SET Current_Occupancy = Current_Occupancy + 1 WHERE Room_ID = NEW.Room_ID;
+END;
+
+CREATE TRIGGER trg_room_before_update_student
+BEFORE UPDATE ON Student
+FOR EACH ROW WHEN NEW.Room_ID IS NOT NULL
+    AND (OLD.Room_ID IS NULL OR NEW.Room_ID <> OLD.Room_ID)
+    AND hostel_bulk_load() = 0
+BEGIN
+    SELECT RAISE(ABORT, 'Target room is full: cannot move student.')
+    FROM Room WHERE Room_ID = NEW.Room_ID AND Current_Occupancy >= Capacity;
+END;
+
+CREATE TRIGGER trg_room_after_update_student
+AFTER UPDATE ON Student
+FOR EACH ROW WHEN OLD.Room_ID IS NOT NEW.Room_ID AND hostel_bulk_load() = 0
+BEGIN
+    UPDATE Room
+    SET Current_Occupancy = CASE WHEN Current_Occupancy > 0 THEN Current_Occupancy - 1 ELSE 0 END
+    WHERE Room_ID = OLD.Room_ID;
+    UPDATE Room SET Current_Occupancy = Current_Occupancy + 1 WHERE Room_ID = NEW.Room_ID;
+END;
+
+CREATE TRIGGER trg_decrease_room_occupancy
+AFTER DELETE ON Student
+FOR EACH ROW WHEN OLD.Room_ID IS NOT NULL
+BEGIN
+    UPDATE Room
+    SET Current_Occupancy = CASE WHEN Current_Occupancy > 0 THEN Current_Occupancy - 1 ELSE 0 END
+    WHERE Room_ID = OLD.Room_ID;
+END;
+
+-- ===========================================================
+--  SUMMARY COUNTER TRIGGERS (feed Hostel_Summary)
+-- ===========================================================
+CREATE TRIGGER trg_summary_after_insert_student
+AFTER INSERT ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Students = Total_Students + 1,
+        Pending_Fees = Pending_Fees + (NEW.Fee_Status IS 'Pending')
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_update_student
+AFTER UPDATE ON Student
+FOR EACH ROW WHEN OLD.Fee_Status IS NOT NEW.Fee_Status
+BEGIN
+    UPDATE Hostel_Summary
+    SET Pending_Fees = Pending_Fees
+        + (NEW.Fee_Status IS 'Pending') - (OLD.Fee_Status IS 'Pending')
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_delete_student
+AFTER DELETE ON Student
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Students = Total_Students - 1,
+        Pending_Fees = Pending_Fees - (OLD.Fee_Status IS 'Pending')
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_insert_room
+AFTER INSERT ON Room
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Rooms = Total_Rooms + 1,
+        Available_Rooms = Available_Rooms + (NEW.Current_Occupancy < NEW.Capacity),
+        Free_Beds = Free_Beds + MAX(NEW.Capacity - NEW.Current_Occupancy, 0)
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_update_room
+AFTER UPDATE ON Room
+FOR EACH ROW WHEN OLD.Current_Occupancy <> NEW.Current_Occupancy OR OLD.Capacity <> NEW.Capacity
+BEGIN
+    UPDATE Hostel_Summary
+    SET Available_Rooms = Available_Rooms
+            + (NEW.Current_Occupancy < NEW.Capacity)
+            - (OLD.Current_Occupancy < OLD.Capacity),
+        Free_Beds = Free_Beds
+            + MAX(NEW.Capacity - NEW.Current_Occupancy, 0)
+            - MAX(OLD.Capacity - OLD.Current_Occupancy, 0)
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_delete_room
+AFTER DELETE ON Room
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Total_Rooms = Total_Rooms - 1,
+        Available_Rooms = Available_Rooms - (OLD.Current_Occupancy < OLD.Capacity),
+        Free_Beds = Free_Beds - MAX(OLD.Capacity - OLD.Current_Occupancy, 0)
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_insert_complaint
+AFTER INSERT ON Complaint
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Open_Complaints = Open_Complaints + (NEW.Status IS 'Open'),
+        In_Progress_Complaints = In_Progress_Complaints + (NEW.Status IS 'In Progress'),
+        Resolved_Complaints = Resolved_Complaints + (NEW.Status IS 'Resolved')
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_update_complaint
+AFTER UPDATE ON Complaint
+FOR EACH ROW WHEN OLD.Status IS NOT NEW.Status
+BEGIN
+    UPDATE Hostel_Summary
+    SET Open_Complaints = Open_Complaints
+            + (NEW.Status IS 'Open') - (OLD.Status IS 'Open'),
+        In_Progress_Complaints = In_Progress_Complaints
+            + (NEW.Status IS 'In Progress') - (OLD.Status IS 'In Progress'),
+        Resolved_Complaints = Resolved_Complaints
+            + (NEW.Status IS 'Resolved') - (OLD.Status IS 'Resolved')
+    WHERE Summary_ID = 1;
+END;
+
+CREATE TRIGGER trg_summary_after_delete_complaint
+AFTER DELETE ON Complaint
+FOR EACH ROW
+BEGIN
+    UPDATE Hostel_Summary
+    SET Open_Complaints = Open_Complaints - (OLD.Status IS 'Open'),
+        In_Progress_Complaints = In_Progress_Complaints - (OLD.Status IS 'In Progress'),
+        Resolved_Complaints = Resolved_Complaints - (OLD.Status IS 'Resolved')
+    WHERE Summary_ID = 1;
+END;
+
+-- ===========================================================
+--  SAMPLE DATA (same as hostel.sql)
+-- ===========================================================
+INSERT INTO Room (Block_Name, Room_No, Capacity, Current_Occupancy) VALUES
+('A', 'A-101', 3, 0),
+('A', 'A-102', 2, 0),
+('B', 'B-201', 4, 0),
+('B', 'B-202', 3, 0);
+
+INSERT INTO Staff (Staff_Name, Role, Contact_Number, Email, Salary)
+VALUES
+('Ravi Kumar', 'Warden', '9876543210', 'ravi.k@college.com', 40000.00),
+('Priya Sharma', 'Accountant', '9988776655', 'priya.s@college.com', 35000.00);
+
+INSERT INTO Student (Name, Gender, Department, Room_ID, Fee_Status) VALUES
+('Aarav Mehta', 'Male', 'CSE', 1, 'Pending'),
+('Diya Sharma', 'Female', 'ECE', 2, 'Paid'),
+('Rohit Patel', 'Male', 'Mechanical', 3, 'Pending'),
+('Neha Reddy', 'Female', 'IT', 1, 'Pending');
+
+INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Date, Payment_Mode, Staff_ID)
+VALUES
+(1, 25000, '2025-10-30', 'UPI', 2),
+(3, 26000, '2025-11-01', 'Card', 2);
+
+INSERT INTO Complaint (Student_ID, Complaint_Text, Status)
+VALUES (1, 'Fan not working in my room', 'Open');
@@ -0,0 +1,494 @@
+"""Gradio UI for the hostel database.
+
+Hostel_management is the data layer and the headless CLI; it never imports
+this module except for `serve`, so cron jobs and scripts skip gradio.
+
+    python Hostel_management.py serve
+"""
+import sys
+
+import gradio as gr
+import pandas as pd
+
+import Hostel_management as hm
+
+# =============================================================================
+# UI HELPERS (status text + tables for the Gradio events)
+# =============================================================================
+def export_table_ui(table_name, columns, filter_col, filter_val, fmt):
+    try:
+        filters = {filter_col: filter_val} if filter_col else None
+        r = hm.export_rows(table_name, fmt, columns=columns or None, filters=filters)
+        return r["path"], f"✅ {r['rows']} rows exported ({r['bytes']} bytes, {r['elapsed_s']}s)"
+    except Exception as e:
+        return None, f"❌ Error: {e}"
+
+def reconcile_occupancy_ui(dry_run):
+    try:
+        r = hm.reconcile_occupancy(dry_run=dry_run)
+    except Exception as e:
+        return f"❌ Error: {e}", pd.DataFrame()
+    verb = "would fix" if r["dry_run"] else "fixed"
+    msg = (f"✅ {r['drifted']} room(s) drifted, {verb} {r['drifted'] if r['dry_run'] else r['fixed']}"
+           f"{', ' + str(r['skipped']) + ' changed during the run' if r['skipped'] else ''}"
+           f"{', ' + str(r['over_capacity']) + ' over capacity' if r['over_capacity'] else ''}"
+           f" ({r['elapsed_s']}s)")
+    return msg, r["drift"]
+
+def archive_history_ui(before, dry_run):
+    try:
+        r = hm.archive_history(before or None, dry_run=dry_run)
+    except Exception as e:
+        return f"❌ Error: {e}"
+    parts = []
+    for name in hm.ARCHIVE_SOURCES:
+        x = r.get(name, {})
+        if "error" in x:
+            parts.append(f"{name}: {x['error']}")
+        else:
+            parts.append(f"{x['eligible']} {name} eligible" if r["dry_run"] else f"{x['moved']} {name} archived")
+    return f"✅ Before {r['before']}: " + ", ".join(parts) + f" ({r['elapsed_s']}s)"
+
+def import_students_ui(upload):
+    if upload is None:
+        return "❌ Error: Please upload a CSV file.", pd.DataFrame()
+    try:
+        report = hm.import_students_csv(upload)
+    except Exception as e:
+        return f"❌ Error: {e}", pd.DataFrame()
+    status = (f"✅ Imported {report['inserted']} of {report['rows']} rows "
+              f"({report['rejected']} rejected) in {report['elapsed_s']}s")
+    if report["oversubscribed_rooms"]:
+        status += f"\n⚠ Over-subscribed rooms (extra requests): {report['oversubscribed_rooms']}"
+    rejects = pd.DataFrame(report["rejects"], columns=["Line", "Student_ID", "Reason"])
+    return status, rejects
+
+def allocate_rooms_ui(preferences, strict_block, commit):
+    try:
+        result = hm.allocate_rooms(preferences, dry_run=not commit, strict_block=bool(strict_block))
+    except Exception as e:
+        return f"❌ Error: {e}", pd.DataFrame()
+    verb = "Assigned" if commit else "Dry run: would assign"
+    status = (f"{'✅' if commit else '🧪'} {verb} {result['assigned']} of {result['students']} unassigned students "
+              f"({len(result['unplaced'])} unplaced) · timings {result['timings']}")
+    plan = result["plan"]
+    if result["unplaced"]:
+        plan = pd.concat([plan, pd.DataFrame(
+            [(sid, None, why) for sid, why in result["unplaced"]],
+            columns=["Student_ID", "Room_ID", "Note"])], ignore_index=True)
+    return status, plan.head(2000)
+
+def move_students_ui(upload, allow_mixed, commit):
+    if upload is None:
+        return "❌ Error: Please upload a CSV file (Student_ID, Room_ID).", pd.DataFrame()
+    try:
+        result = hm.move_students(upload, dry_run=not commit, allow_mixed=bool(allow_mixed))
+    except Exception as e:
+        return f"❌ Error: {e}", pd.DataFrame()
+    if result["rejects"]:
+        return (f"❌ {len(result['rejects'])} problem(s); nothing moved ({result['moves']} valid moves checked)",
+                pd.DataFrame(result["rejects"], columns=["Line", "Student_ID", "Room_ID", "Reason"]))
+    verb = "Moved" if result["applied"] else "Dry run: would move"
+    status = (f"{'✅' if result['applied'] else '🧪'} {verb} {result['moves']} students across "
+              f"{result['rooms_touched']} rooms ({result['unchanged']} already in place) · timings {result['timings']}")
+    return status, result["plan"].head(2000)
+
+def import_payments_ui(upload, default_mode):
+    """Gradio generator: streams progress while the statement is ingested."""
+    if upload is None:
+        yield "❌ Error: Please upload a statement CSV.", pd.DataFrame()
+        return
+    try:
+        for report in hm.import_payments_iter(upload, default_mode or "Bank Transfer"):
+            yield (f"⏳ {report['rows']} lines read · {report['inserted']} recorded · "
+                   f"{report['duplicates']} already recorded · {report['rejected']} rejected"), pd.DataFrame()
+    except Exception as e:
+        yield f"❌ Error: {e}", pd.DataFrame()
+        return
+    rejects = pd.DataFrame(report["rejects"], columns=["Line", "Reference", "Reason"])
+    yield (f"✅ {report['inserted']} payments recorded, {report['duplicates']} already recorded, "
+           f"{report['rejected']} rejected ({report['rows']} lines, {report['elapsed_s']}s)"), rejects
+
+def fee_analytics_ui(term):
+    try:
+        r = hm.fee_analytics(term or None)
+    except Exception as e:
+        return (f"❌ Error: {e}",) + (pd.DataFrame(),) * 5
+    s = r["summary"].iloc[0]
+    status = (f"✅ Term from {r['term_start']}: {s['Collected']:,.2f} collected of {s['Due']:,.2f} due, "
+              f"{s['Outstanding']:,.2f} outstanding · {s['Paid']} paid, {s['Partial']} partial, {s['Unpaid']} unpaid"
+              f" · {s['Marked_Paid_With_Balance']} marked Paid with a balance ({r['source']}, {r['timings']['total_s']}s)")
+    return status, r["ageing"], r["by_month"], r["by_mode"], r["by_department"], r["balances"].head(2000)
+
+def bulk_transition_ui(new_status, ids, room_id, block_name, text):
+    try:
+        n = hm.transition_complaints(new_status, ids, room_id, block_name, text)
+        status = f"✅ {n} complaint(s) moved to '{new_status}'."
+    except Exception as e:
+        status = f"❌ Error: {e}"
+    return status, hm.view_complaints(None)
+
+# =============================================================================
+# GRADIO APP
+# =============================================================================
+DB_EVENT = {"concurrency_id": "db", "concurrency_limit": hm.UI_DB_CONCURRENCY}
+HEAVY_EVENT = {"concurrency_id": "db_heavy", "concurrency_limit": hm.UI_HEAVY_CONCURRENCY}
+# live ticks only read LiveFeed's in-memory snapshot
+LIVE_EVENT = {"concurrency_limit": None, "show_progress": "hidden"}
+
+def create_app():
+    """Build the Gradio UI on top of the Hostel_management handlers."""
+    with gr.Blocks(title="🏫 Hostel Management System", theme=gr.themes.Soft()) as app:
+        gr.Markdown("# 🔐 Hostel Management System — Login")
+
+        # Login
+        with gr.Group(visible=True) as login_group:
+            with gr.Row():
+                username_in = gr.Textbox(label="Username")
+                password_in = gr.Textbox(label="Password", type="password")
+            login_btn = gr.Button("Login")
+            login_status = gr.Textbox(label="Status", interactive=False)
+
+        # Main
+        with gr.Group(visible=False) as main_group:
+            gr.Markdown("## 🏫 College Dorm Management System")
+            nav = gr.Radio(
+                choices=["Dashboard", "View Tables", "Student Mgmt", "Fee Payment", "Complaints", "Student Details", "Logout"],
+                value="Dashboard",
+                label="📋 Navigation"
+            )
+
+            # Panels (Groups; we toggle visibility)
+            with gr.Group(visible=True) as p_dashboard:
+                gr.Markdown("### 📊 Overview of Hostel Data")
+                dash_btn = gr.Button("Refresh Dashboard")
+                dash_live = gr.Markdown()
+                dash_out = gr.Dataframe(label="Summary", interactive=False)
+                dash_btn.click(hm.dashboard_summary, outputs=dash_out, **DB_EVENT)
+
+            with gr.Group(visible=False) as p_tables:
+                gr.Markdown("### 👀 View Tables")
+                table_select = gr.Dropdown(sorted(hm.ALLOWED_TABLES), label="Select Table")
+                with gr.Row():
+                    tbl_page_size = gr.Number(value=hm.DEFAULT_PAGE_SIZE, label="Rows per page", precision=0)
+                    tbl_columns = gr.Textbox(label="Columns (comma-separated, blank = all)")
+                with gr.Row():
+                    tbl_filter_col = gr.Dropdown([], label="Filter column (indexed)")
+                    tbl_filter_val = gr.Textbox(label="Filter value")
+                with gr.Row():
+                    view_btn = gr.Button("View Data")
+                    prev_btn = gr.Button("◀ Prev")
+                    next_btn = gr.Button("Next ▶")
+                tbl_info = gr.Markdown()
+                output_table = gr.Dataframe(label="Table Data", interactive=False)
+                tbl_cursor = gr.State(value=None)
+
+                table_select.change(
+                    lambda t: gr.update(choices=list(hm.TABLE_FILTERS.get(t, ())), value=None),
+                    inputs=table_select, outputs=tbl_filter_col
+                )
+                tbl_inputs = [table_select, tbl_page_size, tbl_columns, tbl_filter_col, tbl_filter_val, tbl_cursor]
+                tbl_outputs = [output_table, tbl_info, tbl_cursor]
+                view_btn.click(lambda t, n, c, fc, fv, cur: hm.view_table_page(t, n, c, fc, fv, cur, "first"),
+                               inputs=tbl_inputs, outputs=tbl_outputs, **HEAVY_EVENT)
+                prev_btn.click(lambda t, n, c, fc, fv, cur: hm.view_table_page(t, n, c, fc, fv, cur, "prev"),
+                               inputs=tbl_inputs, outputs=tbl_outputs, **HEAVY_EVENT)
+                next_btn.click(lambda t, n, c, fc, fv, cur: hm.view_table_page(t, n, c, fc, fv, cur, "next"),
+                               inputs=tbl_inputs, outputs=tbl_outputs, **HEAVY_EVENT)
+
+                with gr.Row():
+                    exp_fmt = gr.Dropdown(list(hm.EXPORT_FORMATS), value="csv", label="Export format")
+                    exp_btn = gr.Button("Export Full Table")
+                exp_status = gr.Textbox(label="Export", interactive=False)
+                exp_file = gr.File(label="Download", interactive=False)
+                exp_btn.click(export_table_ui, inputs=[table_select, tbl_columns, tbl_filter_col, tbl_filter_val, exp_fmt],
+                              outputs=[exp_file, exp_status], **HEAVY_EVENT)
+
+            with gr.Group(visible=False) as p_students:
+                gr.Markdown("### 👩‍🎓 Student Management")
+
+                gr.Markdown("#### ➕ Add Student (requires Student ID)")
+                add_sid  = gr.Number(label="Student ID", precision=0)
+                add_name = gr.Textbox(label="Name")
+                add_gender = gr.Dropdown(["Male", "Female", "Other"], label="Gender")
+                add_dept = gr.Textbox(label="Department")
+                add_room = gr.Number(label="Room ID")
+                btn_add_stud = gr.Button("Add Student")
+                out_stud = gr.Textbox(label="Status", interactive=False)
+                btn_add_stud.click(hm.add_student, inputs=[add_sid, add_name, add_gender, add_dept, add_room], outputs=out_stud, **DB_EVENT)
+
+                gr.Markdown("#### ✏ Update Student")
+                stud_id_up = gr.Number(label="Student ID", precision=0)
+                new_dept = gr.Textbox(label="New Department")
+                new_fee = gr.Dropdown(["Paid", "Pending"], label="Fee Status")
+                update_btn = gr.Button("Update Student")
+                out_update = gr.Textbox(label="Status", interactive=False)
+                update_btn.click(hm.update_student, inputs=[stud_id_up, new_dept, new_fee], outputs=out_update, **DB_EVENT)
+
+                gr.Markdown("#### ❌ Delete Student")
+                del_id = gr.Number(label="Student ID to Delete", precision=0)
+                del_btn = gr.Button("Delete Student")
+                del_out = gr.Textbox(label="Status", interactive=False)
+                del_btn.click(hm.delete_student, inputs=del_id, outputs=del_out, **DB_EVENT)
+
+                gr.Markdown("#### ⚠ Raise Complaint (quick access)")
+                rc_sid = gr.Number(label="Student ID", precision=0)
+                rc_text = gr.Textbox(label="Complaint Text", lines=3)
+                rc_btn = gr.Button("Raise Complaint")
+                rc_status = gr.Textbox(label="Status", interactive=False)
+                rc_table = gr.Dataframe(label="Complaints for Student", interactive=False)
+                rc_btn.click(hm.raise_complaint, inputs=[rc_sid, rc_text], outputs=[rc_status, rc_table], **DB_EVENT)
+
+                gr.Markdown("#### 📥 Bulk Import Students (CSV: Student_ID, Name, Gender, Department, Room_ID[, Fee_Status])")
+                imp_file = gr.File(label="Students CSV", file_types=[".csv"])
+                imp_btn = gr.Button("Import Students")
+                imp_status = gr.Textbox(label="Status", interactive=False)
+                imp_rejects = gr.Dataframe(label="Rejected Rows", interactive=False)
+                imp_btn.click(import_students_ui, inputs=imp_file, outputs=[imp_status, imp_rejects], **HEAVY_EVENT)
+
+                gr.Markdown("#### 🛏 Automatic Room Allocation (students without a room)")
+                alloc_prefs = gr.File(label="Preferences CSV (optional: Student_ID, Preferred_Block, Group)", file_types=[".csv"])
+                with gr.Row():
+                    alloc_strict = gr.Checkbox(label="Preferred block is mandatory", value=False)
+                    alloc_commit = gr.Checkbox(label="Commit (unchecked = dry run)", value=False)
+                alloc_btn = gr.Button("Allocate Rooms")
+                alloc_status = gr.Textbox(label="Status", interactive=False)
+                alloc_plan = gr.Dataframe(label="Allocation Plan", interactive=False)
+                alloc_btn.click(allocate_rooms_ui, inputs=[alloc_prefs, alloc_strict, alloc_commit],
+                                outputs=[alloc_status, alloc_plan], **HEAVY_EVENT)
+
+                gr.Markdown("#### 🔀 Bulk Room Moves (CSV: Student_ID, Room_ID; blank Room_ID = move out)")
+                mv_file = gr.File(label="Moves CSV", file_types=[".csv"])
+                with gr.Row():
+                    mv_mixed = gr.Checkbox(label="Allow mixed-gender rooms", value=False)
+                    mv_commit = gr.Checkbox(label="Commit (unchecked = dry run)", value=False)
+                mv_btn = gr.Button("Move Students")
+                mv_status = gr.Textbox(label="Status", interactive=False)
+                mv_plan = gr.Dataframe(label="Moves / Problems", interactive=False)
+                mv_btn.click(move_students_ui, inputs=[mv_file, mv_mixed, mv_commit],
+                             outputs=[mv_status, mv_plan], **HEAVY_EVENT)
+
+                gr.Markdown("#### 🧮 Occupancy Check (Room.Current_Occupancy vs. students)")
+                occ_dry = gr.Checkbox(label="Dry run (report only)", value=True)
+                occ_btn = gr.Button("Reconcile Occupancy")
+                occ_status = gr.Textbox(label="Status", interactive=False)
+                occ_drift = gr.Dataframe(label="Drifted Rooms", interactive=False)
+                occ_btn.click(reconcile_occupancy_ui, inputs=occ_dry, outputs=[occ_status, occ_drift], **HEAVY_EVENT)
+
+                gr.Markdown("#### 🗄 Archive Past Terms (resolved complaints, fee payments)")
+                with gr.Row():
+                    arc_before = gr.Textbox(label=f"Before (YYYY-MM-DD, blank = this term's start {hm.term_start()})")
+                    arc_dry = gr.Checkbox(label="Dry run (count only)", value=True)
+                arc_btn = gr.Button("Archive")
+                arc_status = gr.Textbox(label="Status", interactive=False)
+                arc_btn.click(archive_history_ui, inputs=[arc_before, arc_dry], outputs=arc_status, **HEAVY_EVENT)
+
+            with gr.Group(visible=False) as p_fees:
+                gr.Markdown("### 💰 Fee Payment (no Staff ID)")
+                fp_sid = gr.Number(label="Student ID", precision=0)
+                fp_amount = gr.Number(label="Amount")
+                fp_mode = gr.Dropdown(list(hm.PAYMENT_MODES), label="Payment Mode")
+                fp_btn = gr.Button("Add Payment")
+                fp_out = gr.Textbox(label="Status", interactive=False)
+                fp_btn.click(hm.add_payment, inputs=[fp_sid, fp_amount, fp_mode], outputs=fp_out, **DB_EVENT)
+
+                gr.Markdown("#### 🏦 Import Bank / UPI Statement (CSV with Reference, Amount, Student_ID or Narration)")
+                st_file = gr.File(label="Statement CSV", file_types=[".csv"])
+                st_mode = gr.Dropdown(list(hm.PAYMENT_MODES), value="Bank Transfer", label="Default Payment Mode")
+                st_btn = gr.Button("Import Statement")
+                st_status = gr.Textbox(label="Progress", interactive=False)
+                st_rejects = gr.Dataframe(label="Rejected Lines", interactive=False)
+                st_btn.click(import_payments_ui, inputs=[st_file, st_mode], outputs=[st_status, st_rejects], **HEAVY_EVENT)
+
+                gr.Markdown("#### 📊 Fee Analytics (balances against FEE_SCHEDULE, collections, ageing)")
+                fa_term = gr.Textbox(label="Any date in the term (YYYY-MM-DD, blank = current term)")
+                fa_btn = gr.Button("Run Fee Report")
+                fa_status = gr.Textbox(label="Summary", interactive=False)
+                with gr.Row():
+                    fa_ageing = gr.Dataframe(label="Outstanding by Age", interactive=False)
+                    fa_mode = gr.Dataframe(label="Collections by Mode (12 months)", interactive=False)
+                fa_month = gr.Dataframe(label="Collections by Month", interactive=False)
+                fa_dept = gr.Dataframe(label="Collections by Department (12 months)", interactive=False)
+                fa_bal = gr.Dataframe(label="Student Balances (largest first)", interactive=False)
+                fa_btn.click(fee_analytics_ui, inputs=fa_term,
+                             outputs=[fa_status, fa_ageing, fa_month, fa_mode, fa_dept, fa_bal], **HEAVY_EVENT)
+
+            with gr.Group(visible=False) as p_complaints:
+                gr.Markdown("### ⚠ Complaints")
+                comp_stud = gr.Number(label="Student ID (optional, leave empty to view all)", precision=0)
+                comp_hist = gr.Checkbox(label="Include archived (past terms)", value=False)
+                refresh_btn = gr.Button("Refresh Complaints")
+                comp_table = gr.Dataframe(label="Existing Complaints", interactive=False)
+                comp_feed = gr.Dataframe(label=f"🟢 Live Feed (newest {hm.LIVE_FEED_SIZE}, updates on its own)",
+                                         interactive=False, visible=hm.LIVE_INTERVAL > 0)
+
+                comp_text = gr.Textbox(label="Complaint Text", lines=3)
+                comp_btn = gr.Button("Raise Complaint")
+                comp_out = gr.Textbox(label="Status", interactive=False)
+
+                refresh_btn.click(hm.view_complaints, inputs=[comp_stud, comp_hist], outputs=comp_table, **DB_EVENT)
+                comp_btn.click(hm.raise_complaint, inputs=[comp_stud, comp_text], outputs=[comp_out, comp_table], **DB_EVENT)
+
+                gr.Markdown("#### 🛠 Update Status (one or many)")
+                with gr.Row():
+                    wf_status = gr.Dropdown(list(hm.COMPLAINT_TRANSITIONS), value="In Progress", label="Move to")
+                    wf_ids = gr.Textbox(label="Complaint IDs (comma or space separated)")
+                    wf_room = gr.Number(label="Room ID", precision=0)
+                    wf_block = gr.Textbox(label="Block Name")
+                    wf_text = gr.Textbox(label="Text contains")
+                wf_btn = gr.Button("Apply Transition")
+                wf_out = gr.Textbox(label="Status", interactive=False)
+                wf_btn.click(bulk_transition_ui, inputs=[wf_status, wf_ids, wf_room, wf_block, wf_text],
+                             outputs=[wf_out, comp_table], **DB_EVENT)
+
+                gr.Markdown("#### ⏱ Aging / SLA Report")
+                with gr.Row():
+                    sla_hours = gr.Number(label="SLA (hours)", value=hm.COMPLAINT_SLA_HOURS)
+                    sla_days = gr.Number(label="Window (days)", value=365, precision=0)
+                    sla_by_block = gr.Checkbox(label="Per block", value=True)
+                sla_btn = gr.Button("Build Report")
+                sla_table = gr.Dataframe(label="Complaint Aging", interactive=False)
+                sla_btn.click(hm.complaint_aging_report, inputs=[sla_hours, sla_days, sla_by_block],
+                              outputs=sla_table, **HEAVY_EVENT)
+
+                gr.Markdown("#### 🔎 Search Complaints")
+                with gr.Row():
+                    cs_query = gr.Textbox(label="Search (e.g. fan, leak, wifi)")
+                    cs_status = gr.Dropdown(["All", *hm.COMPLAINT_STATUSES], value="All", label="Status")
+                    cs_from = gr.Textbox(label="From (YYYY-MM-DD)")
+                    cs_to = gr.Textbox(label="To (YYYY-MM-DD)")
+                with gr.Row():
+                    cs_btn = gr.Button("Search")
+                    cs_prev = gr.Button("◀ Prev")
+                    cs_next = gr.Button("Next ▶")
+                cs_info = gr.Markdown()
+                cs_table = gr.Dataframe(label="Matching Complaints", interactive=False)
+                cs_page = gr.State(value=1)
+
+                def _search_page(q, st, d1, d2, page):
+                    df, info = hm.search_complaints(q, st, d1, d2, page)
+                    return df, info, page
+
+                cs_inputs = [cs_query, cs_status, cs_from, cs_to]
+                cs_outputs = [cs_table, cs_info, cs_page]
+                cs_btn.click(lambda q, st, d1, d2: _search_page(q, st, d1, d2, 1),
+                             inputs=cs_inputs, outputs=cs_outputs, **DB_EVENT)
+                cs_prev.click(lambda q, st, d1, d2, p: _search_page(q, st, d1, d2, max(1, p - 1)),
+                              inputs=cs_inputs + [cs_page], outputs=cs_outputs, **DB_EVENT)
+                cs_next.click(lambda q, st, d1, d2, p: _search_page(q, st, d1, d2, p + 1),
+                              inputs=cs_inputs + [cs_page], outputs=cs_outputs, **DB_EVENT)
+
+            with gr.Group(visible=False) as p_details:
+                gr.Markdown("### 🔍 View Student Details")
+                stud_det_id = gr.Number(label="Student ID", precision=0)
+                det_hist = gr.Checkbox(label="Totals include archived terms", value=False)
+                det_btn = gr.Button("View Details")
+                det_out = gr.Dataframe(interactive=False)
+                det_btn.click(hm.view_student_details, inputs=[stud_det_id, det_hist], outputs=det_out, **DB_EVENT)
+
+                gr.Markdown("#### 🏢 Bulk Lookup (block, room or list of IDs)")
+                with gr.Row():
+                    bulk_ids = gr.Textbox(label="Student IDs (comma or space separated)")
+                    bulk_room = gr.Number(label="Room ID", precision=0)
+                    bulk_block = gr.Textbox(label="Block Name")
+                bulk_btn = gr.Button("Load Students")
+                bulk_out = gr.Dataframe(interactive=False)
+                bulk_btn.click(hm.view_students_bulk, inputs=[bulk_ids, bulk_room, bulk_block, det_hist],
+                               outputs=bulk_out, **DB_EVENT)
+
+        # State for logged-in user
+        user_state = gr.State(value=None)
+
+        # Login handler
+        def handle_login(u, p):
+            u = (u or "").strip()
+            p = (p or "").strip()
+            msg, user = hm.login_user(u, p)
+            if user:
+                return msg, gr.update(visible=False), gr.update(visible=True), user
+            else:
+                return msg, gr.update(visible=True), gr.update(visible=False), None
+
+        login_btn.click(
+            handle_login,
+            [username_in, password_in],
+            [login_status, login_group, main_group, user_state],
+            **DB_EVENT
+        )
+
+        # Navigation handler
+        def update_panels(page, user):
+            # default hide
+            show = {
+                "dashboard": False, "tables": False, "students": False,
+                "fees": False, "complaints": False, "details": False
+            }
+
+            if not user:
+                return (
+                    gr.update(visible=False), gr.update(visible=False), gr.update(visible=False),
+                    gr.update(visible=False), gr.update(visible=False), gr.update(visible=False),
+                    gr.update(visible=True), gr.update(visible=False)
+                )
+
+            role = user.get("Role", "Student")
+
+            if page == "Dashboard":
+                show["dashboard"] = True
+            elif page == "View Tables":
+                if role in ("Admin", "Staff"): show["tables"] = True
+            elif page == "Student Mgmt":
+                if role in ("Admin", "Staff"): show["students"] = True
+            elif page == "Fee Payment":
+                if role in ("Admin", "Staff"): show["fees"] = True
+            elif page == "Complaints":
+                show["complaints"] = True
+            elif page == "Student Details":
+                show["details"] = True
+            elif page == "Logout":
+                return (
+                    gr.update(visible=False), gr.update(visible=False), gr.update(visible=False),
+                    gr.update(visible=False), gr.update(visible=False), gr.update(visible=False),
+                    gr.update(visible=True), gr.update(visible=False)
+                )
+
+            return (
+                gr.update(visible=show["dashboard"]),
+                gr.update(visible=show["tables"]),
+                gr.update(visible=show["students"]),
+                gr.update(visible=show["fees"]),
+                gr.update(visible=show["complaints"]),
+                gr.update(visible=show["details"]),
+                gr.update(visible=False),  # login hidden
+                gr.update(visible=True),   # main visible
+            )
+
+        nav.change(
+            fn=update_panels,
+            inputs=[nav, user_state],
+            outputs=[p_dashboard, p_tables, p_students, p_fees, p_complaints, p_details, login_group, main_group]
+        )
+
+        # Live Dashboard / complaint feed: each tick reads the shared snapshot and
+        # sends only the parts that changed since this session last drew
+        if hm.LIVE_INTERVAL > 0:
+            live_seen = gr.State({})
+
+            def live_tick(seen):
+                seen, changes = hm.live_poll(seen)
+                if changes is None:
+                    return seen, gr.update(), gr.update(), gr.update()
+                return (seen,
+                        gr.update() if changes["dashboard"] is None else changes["dashboard"],
+                        gr.update() if changes["complaints"] is None else changes["complaints"],
+                        changes["message"])
+
+            live_timer = gr.Timer(hm.LIVE_INTERVAL)
+            live_timer.tick(live_tick, inputs=live_seen, outputs=[live_seen, dash_out, comp_feed, dash_live],
+                            **LIVE_EVENT)
+
+    app.queue(default_concurrency_limit=hm.UI_DB_CONCURRENCY, max_size=hm.UI_QUEUE_MAX)
+    return app
+
+if __name__ == "__main__":
+    sys.exit(hm.main(["serve"]))
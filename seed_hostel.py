@@ -0,0 +1,206 @@
+"""Reproducible synthetic data for the hostel database.
+
+    python seed_hostel.py --rooms 5000 --students 15000 --payments 3 --complaints 1 --reset
+
+Same --seed, same data. Rows are bulk-inserted with executemany in large
+chunks under bulk_load_session (per-row occupancy / fee triggers off), then
+occupancy, fee status and the dashboard counters are fixed up set-based.
+"""
+import argparse
+import json
+import math
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import Hostel_management as hm
+
+SEED_CHUNK = 5000
+BLOCKS = "ABCDEFGHJK"
+DEPARTMENTS = ("CSE", "ECE", "EEE", "Mechanical", "Civil", "IT", "Chemical", "Biotech")
+FIRST_NAMES = ("Aarav", "Diya", "Rohit", "Neha", "Karan", "Isha", "Vikram", "Ananya",
+               "Rahul", "Priya", "Arjun", "Meera", "Sanjay", "Kavya", "Nikhil", "Pooja")
+LAST_NAMES = ("Mehta", "Sharma", "Patel", "Reddy", "Iyer", "Khan", "Das", "Nair",
+              "Gupta", "Singh", "Rao", "Joshi", "Verma", "Bose", "Menon", "Kulkarni")
+COMPLAINT_TEXTS = (
+    "Fan not working in my room", "Water leak in bathroom", "Wifi keeps disconnecting",
+    "Tube light flickering", "No hot water in the morning", "Door lock is broken",
+    "Bed frame cracked", "Window glass broken", "Power socket sparking",
+    "Cupboard hinge loose", "Mosquito problem near the corridor", "AC making noise",
+    "Drain blocked in washroom", "Ceiling leaking after rain", "Mess food quality poor",
+)
+COMPLAINT_STATUS_WEIGHTS = (("Open", 0.3), ("In Progress", 0.2), ("Resolved", 0.5))
+
+
+def _weighted(rng, pairs):
+    x, acc = rng.random(), 0.0
+    for value, w in pairs:
+        acc += w
+        if x < acc:
+            return value
+    return pairs[-1][0]
+
+
+def _insert(cur, conn, sql, rows):
+    for chunk in hm.chunked(rows, SEED_CHUNK):
+        cur.executemany(sql, chunk)
+        conn.commit()
+
+
+def reset_tables(conn, cur):
+    cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        archives = [f"{t}_Archive" for t in ("Complaint", "Fee_Payment") if hm.has_archive(t)]
+        rollups = ["Fee_Daily_Rollup", "Fee_Student_Rollup"] if hm.has_fee_rollups() else []
+        for t in archives + rollups + ["Complaint", "Fee_Payment", "Student", "Room"]:
+            cur.execute(f"TRUNCATE TABLE {t}")
+        if rollups:
+            cur.execute("UPDATE Fee_Rollup_State SET Last_Payment_ID = 0, Refreshed_At = NULL")
+    finally:
+        cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+    conn.commit()
+
+
+def generate(rooms, students, payments_per_student=2.0, complaints_per_student=0.5,
+             seed=42, reset=False, days=365):
+    """Load rooms / students / payments / complaints; returns row counts and timings.
+
+    Students fill rooms in order, one gender per room, until beds run out;
+    the rest stay unassigned. Per-student payment and complaint counts are
+    Poisson-ish around the given means."""
+    rng = random.Random(seed)
+    today = date.today()
+    timings = {}
+    conn = hm.get_connection(); cur = conn.cursor()
+    try:
+        if reset:
+            reset_tables(conn, cur)
+        cur.execute("SELECT COALESCE(MAX(Room_ID), 0) FROM Room")
+        room_base = cur.fetchone()[0]
+        cur.execute("SELECT COALESCE(MAX(Student_ID), 0) FROM Student")
+        student_base = cur.fetchone()[0]
+
+        with hm.bulk_load_session(cur):
+            t0 = time.perf_counter()
+            room_rows, capacities = [], []
+            for i in range(rooms):
+                rid = room_base + i + 1
+                block = BLOCKS[i % len(BLOCKS)]
+                cap = rng.choice((2, 3, 3, 4))
+                capacities.append(cap)
+                room_rows.append((rid, block, f"{block}-{100 + i // len(BLOCKS)}", cap))
+            _insert(cur, conn, "INSERT INTO Room (Room_ID, Block_Name, Room_No, Capacity, Current_Occupancy) "
+                               "VALUES (%s, %s, %s, %s, 0)", room_rows)
+            timings["rooms_s"] = round(time.perf_counter() - t0, 3)
+
+            t0 = time.perf_counter()
+            student_rows = []
+            room_idx, left, room_gender = 0, (capacities[0] if rooms else 0), None
+            for i in range(students):
+                sid = student_base + i + 1
+                gender = rng.choice(("Male", "Female"))
+                rid = None
+                if room_idx < rooms:
+                    if room_gender not in (None, gender) or left == 0:
+                        room_idx += 1
+                        if room_idx < rooms:
+                            left, room_gender = capacities[room_idx], None
+                    if room_idx < rooms:
+                        rid = room_base + room_idx + 1
+                        left -= 1
+                        room_gender = gender
+                student_rows.append((sid, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                                     gender, rng.choice(DEPARTMENTS), rid, "Pending"))
+            _insert(cur, conn, hm._INSERT_STUDENT_SQL, student_rows)
+            cur.execute(
+                "UPDATE Room SET Current_Occupancy = "
+                "(SELECT COUNT(*) FROM Student s WHERE s.Room_ID = Room.Room_ID) WHERE Room_ID > %s",
+                (room_base,)
+            )
+            conn.commit()
+            timings["students_s"] = round(time.perf_counter() - t0, 3)
+
+            t0 = time.perf_counter()
+            payment_rows, n_payments = [], 0
+            for sid, *_ in student_rows:
+                for _ in range(_poisson(rng, payments_per_student)):
+                    payment_rows.append((sid, rng.choice((15000, 20000, 25000, 5000)),
+                                         today - timedelta(days=rng.randrange(days)),
+                                         rng.choice(hm.PAYMENT_MODES)))
+                if len(payment_rows) >= SEED_CHUNK:
+                    _insert(cur, conn, "INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Date, Payment_Mode) "
+                                       "VALUES (%s, %s, %s, %s)", payment_rows)
+                    n_payments += len(payment_rows); payment_rows = []
+            _insert(cur, conn, "INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Date, Payment_Mode) "
+                               "VALUES (%s, %s, %s, %s)", payment_rows)
+            n_payments += len(payment_rows)
+            cur.execute(
+                "UPDATE Student SET Fee_Status = 'Paid' WHERE Student_ID > %s AND Student_ID IN "
+                "(SELECT Student_ID FROM Fee_Payment)",
+                (student_base,)
+            )
+            conn.commit()
+            timings["payments_s"] = round(time.perf_counter() - t0, 3)
+
+            t0 = time.perf_counter()
+            complaint_rows, n_complaints = [], 0
+            for sid, *_ in student_rows:
+                for _ in range(_poisson(rng, complaints_per_student)):
+                    when = datetime.combine(today - timedelta(days=rng.randrange(days)), datetime.min.time())
+                    complaint_rows.append((sid, rng.choice(COMPLAINT_TEXTS),
+                                           when + timedelta(minutes=rng.randrange(24 * 60)),
+                                           _weighted(rng, COMPLAINT_STATUS_WEIGHTS)))
+                if len(complaint_rows) >= SEED_CHUNK:
+                    _insert(cur, conn, "INSERT INTO Complaint (Student_ID, Complaint_Text, Complaint_Date, Status) "
+                                       "VALUES (%s, %s, %s, %s)", complaint_rows)
+                    n_complaints += len(complaint_rows); complaint_rows = []
+            _insert(cur, conn, "INSERT INTO Complaint (Student_ID, Complaint_Text, Complaint_Date, Status) "
+                               "VALUES (%s, %s, %s, %s)", complaint_rows)
+            n_complaints += len(complaint_rows)
+            timings["complaints_s"] = round(time.perf_counter() - t0, 3)
+
+        cur.execute("CALL RefreshHostelSummary()")
+        conn.commit()
+    finally:
+        cur.close(); conn.close()
+    hm.invalidate_reads()
+    return {
+        "seed": seed,
+        "rooms": rooms,
+        "students": students,
+        "payments": n_payments,
+        "complaints": n_complaints,
+        "timings": timings,
+    }
+
+
+def _poisson(rng, mean):
+    # Knuth's method; fine for the small means used here
+    if mean <= 0:
+        return 0
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=sorted(hm.BACKENDS), default=hm.DB_BACKEND)
+    parser.add_argument("--rooms", type=int, default=1000)
+    parser.add_argument("--students", type=int, default=3000)
+    parser.add_argument("--payments", type=float, default=2.0, help="mean payments per student")
+    parser.add_argument("--complaints", type=float, default=0.5, help="mean complaints per student")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true",
+                        help="TRUNCATE Room, Student, Fee_Payment, Complaint (and their archives, fee rollups) first")
+    args = parser.parse_args(argv)
+    hm.DB_BACKEND = args.backend
+    out = generate(args.rooms, args.students, args.payments, args.complaints, args.seed, args.reset)
+    print(json.dumps(out, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Fixtures: every test that uses `db` runs once per backend.
+
+SQLite always runs, on a throwaway file created from hostel_sqlite.sql. MySQL
+runs when HOSTEL_DB_HOST (and optionally HOSTEL_DB_PORT / _USER / _PASS /
+_NAME) points at a database loaded from hostel.sql. Tests only touch rows
+they create, so a shared database is fine."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Hostel_management as hm  # noqa: E402
+
+
+def _reset_process_state():
+    # pooled connections, compiled SQL and cached reads all belong to one database
+    if hm._pool is not None:
+        hm._pool.dispose()
+        hm._pool = None
+    hm.refresh_schema()
+    hm._result_cache.invalidate()
+
+
+# HOSTEL_DB_* variable -> Hostel_management setting
+MYSQL_SETTINGS = {"HOST": "DB_HOST", "PORT": "DB_PORT", "USER": "DB_USER", "PASS": "DB_PASS", "NAME": "DB_NAME"}
+
+
+def _mysql_settings():
+    if not os.getenv("HOSTEL_DB_HOST"):
+        return None
+    out = {attr: os.environ[f"HOSTEL_DB_{key}"] for key, attr in MYSQL_SETTINGS.items()
+           if f"HOSTEL_DB_{key}" in os.environ}
+    if "DB_PORT" in out:
+        out["DB_PORT"] = int(out["DB_PORT"])
+    return out
+
+
+@pytest.fixture(scope="session", params=["sqlite", "mysql"])
+def db(request, tmp_path_factory):
+    saved = {attr: getattr(hm, attr)
+             for attr in ("DB_BACKEND", "SQLITE_PATH", "DB_REPLICAS", *MYSQL_SETTINGS.values())}
+    if request.param == "mysql":
+        settings = _mysql_settings()
+        if settings is None:
+            pytest.skip("set HOSTEL_DB_HOST (and _PORT / _USER / _PASS / _NAME) to test against MySQL")
+    else:
+        settings = {"SQLITE_PATH": str(tmp_path_factory.mktemp("hostel") / "hostel.db")}
+    settings.update(DB_BACKEND=request.param, DB_REPLICAS=[])
+    for attr, value in settings.items():
+        setattr(hm, attr, value)
+    _reset_process_state()
+    yield hm
+    _reset_process_state()
+    for attr, value in saved.items():
+        setattr(hm, attr, value)
+
+
+@pytest.fixture
+def sql_count():
+    """Statements executed so far (every cursor is instrumented)."""
+    return lambda: sum(h.count for h in list(hm.metrics.sql_seconds.values()))
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    monkeypatch.setattr(hm, "CACHE_TTL", 0)
@@ -0,0 +1,47 @@
+"""Group-commit write queue: a submit() that times out has either been
+withdrawn (never written) or waits for the batch that took it."""
+import threading
+
+import pytest
+
+import Hostel_management as hm
+
+
+@pytest.fixture
+def blocked_queue():
+    release, taken, flushed = threading.Event(), threading.Event(), []
+
+    def flush(items):
+        taken.set()
+        release.wait(5)
+        flushed.extend(items)
+        return [None] * len(items)
+
+    q = hm.GroupCommitQueue(flush, max_batch=1, max_wait=0, max_pending=10, name="test-writer")
+    yield q, release, taken, flushed
+    release.set()
+    q.close(5)
+
+
+def test_timed_out_item_is_never_written(blocked_queue):
+    q, release, taken, flushed = blocked_queue
+    first = threading.Thread(target=q.submit, args=("first", 5))
+    first.start()
+    assert taken.wait(5)            # the writer is stuck on "first"
+    with pytest.raises(TimeoutError, match="not saved"):
+        q.submit("second", timeout=0.1)
+    release.set()
+    first.join(5)
+    q.close(5)
+    assert flushed == ["first"]
+    assert q.stats()["cancelled"] == 1
+
+
+def test_item_taken_by_writer_waits_for_commit(blocked_queue):
+    q, release, taken, flushed = blocked_queue
+    threading.Timer(0.3, release.set).start()
+    # the writer picks this up at once, so the timeout cannot withdraw it
+    assert q.submit("only", timeout=0.1) is True
+    assert flushed == ["only"]
+    assert q.stats()["cancelled"] == 0
+
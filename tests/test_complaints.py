@@ -0,0 +1,66 @@
+"""Complaint workflow transitions and the timestamps they record."""
+import pytest
+
+STUDENT_ID = 1
+
+
+@pytest.fixture
+def complaints(db):
+    made = []
+
+    def make(n=1):
+        conn = db.get_connection(); cur = conn.cursor()
+        for i in range(n):
+            cur.execute("INSERT INTO Complaint (Student_ID, Complaint_Text) VALUES (%s, %s)",
+                        (STUDENT_ID, f"workflow test {i}"))
+            made.append(cur.lastrowid)
+        conn.commit()
+        cur.close(); conn.close()
+        return made[-n:]
+
+    yield make
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute(f"DELETE FROM Complaint WHERE Complaint_ID IN ({db.placeholders(len(made))})", tuple(made))
+    conn.commit()
+    cur.close(); conn.close()
+    db.invalidate_reads()
+
+
+def _stamps(db, cid):
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("SELECT Status, In_Progress_At, Resolved_At FROM Complaint WHERE Complaint_ID = %s", (cid,))
+    row = cur.fetchone()
+    cur.close(); conn.close()
+    return row
+
+
+def test_open_to_resolved_leaves_in_progress_unset(db, complaints):
+    cid, = complaints()
+    assert db.transition_complaints("Resolved", [cid]) == 1
+    status, in_progress_at, resolved_at = _stamps(db, cid)
+    assert status == "Resolved"
+    assert in_progress_at is None
+    assert resolved_at is not None
+
+
+def test_in_progress_time_kept_when_resolved(db, complaints):
+    cid, = complaints()
+    db.transition_complaints("In Progress", [cid])
+    started = _stamps(db, cid)[1]
+    assert started is not None
+    db.transition_complaints("Resolved", [cid])
+    assert _stamps(db, cid)[1] == started
+
+
+def test_reopen_clears_timestamps(db, complaints):
+    cid, = complaints()
+    db.transition_complaints("In Progress", [cid])
+    db.transition_complaints("Resolved", [cid])
+    assert db.transition_complaints("Open", [cid]) == 1
+    assert _stamps(db, cid) == ("Open", None, None)
+
+
+def test_disallowed_transition_is_skipped(db, complaints):
+    cid, = complaints()
+    assert db.transition_complaints("Open", [cid]) == 0
+    assert _stamps(db, cid)[0] == "Open"
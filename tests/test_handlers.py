@@ -0,0 +1,169 @@
+"""The public handlers on every backend: reads return data (not error
+frames), writes go through the triggers the same way on both engines."""
+import pytest
+
+STUDENT_ID = 990301
+ROOM_ID = 4          # sample room B-202 (capacity 3, empty)
+SINGLE_ROOM_ID = 990301
+
+READS = [
+    ("dashboard_summary", (), {}),
+    ("dashboard_data", (), {}),
+    ("get_summary_counters", (), {}),
+    ("view_table", ("Student",), {}),
+    ("view_table_page", ("Room", 50, "", "", "", "", "first"), {}),
+    ("estimate_table_rows", ("Student",), {}),
+    ("view_complaints", (None,), {}),
+    ("view_complaints", (1,), {}),
+    ("view_student_details", (1,), {}),
+    ("view_students_bulk", ("1 2 3",), {}),
+    ("view_students_bulk", (), {"block_name": "A"}),
+    ("search_complaints", ("fan",), {}),
+    ("complaint_aging_report", (), {}),
+    ("complaint_aging_report", (), {"by_block": False}),
+    ("fee_analytics", (), {"use_rollups": False}),
+    ("reconcile_occupancy", (), {"dry_run": True}),
+    ("allocate_rooms", (), {"dry_run": True}),
+    ("archive_history", (), {"dry_run": True}),
+]
+
+
+@pytest.mark.parametrize("name,args,kwargs", READS,
+                         ids=[f"{n}-{i}" for i, (n, _, _) in enumerate(READS)])
+def test_read_handler(db, no_cache, name, args, kwargs):
+    result = getattr(db, name)(*args, **kwargs)
+    assert not db._is_error_result(result), result
+    if isinstance(result, dict):
+        assert "error" not in result
+        assert not any(db._is_error_result(v) for v in result.values()), result
+
+
+def _scalar(db, sql, params=()):
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute(sql, params)
+    value = cur.fetchone()[0]
+    cur.close(); conn.close()
+    return value
+
+
+@pytest.fixture
+def cleanup(db):
+    yield
+    conn = db.get_connection(); cur = conn.cursor()
+    for table in ("Complaint", "Fee_Payment", "Student"):
+        cur.execute(f"DELETE FROM {table} WHERE Student_ID IN (%s, %s)", (STUDENT_ID, STUDENT_ID + 1))
+    cur.execute("DELETE FROM Room WHERE Room_ID = %s", (SINGLE_ROOM_ID,))
+    conn.commit()
+    cur.close(); conn.close()
+    db.invalidate_reads()
+
+
+def test_student_lifecycle(db, no_cache, cleanup):
+    occupancy = _scalar(db, "SELECT Current_Occupancy FROM Room WHERE Room_ID = %s", (ROOM_ID,))
+    before = db.get_summary_counters()
+
+    assert db.add_student(STUDENT_ID, "Handler Test", "Female", "CSE", ROOM_ID).startswith("✅")
+    assert _scalar(db, "SELECT Current_Occupancy FROM Room WHERE Room_ID = %s", (ROOM_ID,)) == occupancy + 1
+
+    assert db.update_student(STUDENT_ID, "ECE", "Pending").startswith("✅")
+    assert db.add_payment(STUDENT_ID, 1500, "UPI").startswith("✅")
+    assert _scalar(db, "SELECT Fee_Status FROM Student WHERE Student_ID = %s", (STUDENT_ID,)) == "Paid"
+
+    status, complaints = db.raise_complaint(STUDENT_ID, "handler test: tap leaking")
+    assert not status.startswith("❌"), status
+    assert list(complaints["Student_ID"]) == [STUDENT_ID]
+
+    details = db.view_student_details(STUDENT_ID)
+    assert float(details["Total_Fees_Paid"].iloc[0]) == 1500
+    assert int(details["Total_Complaints"].iloc[0]) == 1
+
+    after = db.get_summary_counters()
+    assert after["Total_Students"] == before["Total_Students"] + 1
+    assert after["Open_Complaints"] == before["Open_Complaints"] + 1
+
+    assert db.delete_student(STUDENT_ID).startswith("🗑")
+    assert _scalar(db, "SELECT Current_Occupancy FROM Room WHERE Room_ID = %s", (ROOM_ID,)) == occupancy
+    assert db.get_summary_counters()["Total_Students"] == before["Total_Students"]
+
+
+def test_full_room_rejected(db, cleanup):
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("INSERT INTO Room (Room_ID, Block_Name, Room_No, Capacity, Current_Occupancy) "
+                "VALUES (%s, %s, %s, %s, 0)", (SINGLE_ROOM_ID, "T", "T-1", 1))
+    conn.commit()
+    cur.close(); conn.close()
+    assert db.add_student(STUDENT_ID, "Handler Test", "Female", "CSE", SINGLE_ROOM_ID).startswith("✅")
+    assert db.add_student(STUDENT_ID + 1, "Handler Test", "Female", "CSE", SINGLE_ROOM_ID).startswith("❌")
+    assert _scalar(db, "SELECT Current_Occupancy FROM Room WHERE Room_ID = %s", (SINGLE_ROOM_ID,)) == 1
+
+
+def test_counters_match_base_tables(db, no_cache):
+    counters = db.get_summary_counters()
+    assert counters["Total_Students"] == _scalar(db, "SELECT COUNT(*) FROM Student")
+    assert counters["Total_Rooms"] == _scalar(db, "SELECT COUNT(*) FROM Room")
+    assert counters["Open_Complaints"] == _scalar(db, "SELECT COUNT(*) FROM Complaint WHERE Status = 'Open'")
+
+
+def test_fee_rollups_match_scan(db, no_cache):
+    db.refresh_fee_rollups(rebuild=True)
+    scan = db.fee_analytics(use_rollups=False)
+    rolled = db.fee_analytics(use_rollups=True)
+    assert rolled["summary"].equals(scan["summary"])
+    assert rolled["balances"].equals(scan["balances"])
+
+
+def test_fee_rollups_pick_up_late_commits(db, no_cache, cleanup, monkeypatch):
+    monkeypatch.setattr(db, "FEE_ROLLUP_OVERLAP", 2)
+    assert db.add_student(STUDENT_ID, "Handler Test", "Female", "CSE", ROOM_ID).startswith("✅")
+    db.refresh_fee_rollups(rebuild=True)
+    conn = db.get_connection(); cur = conn.cursor()
+    for _ in range(4):
+        cur.execute("INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Date, Payment_Mode) "
+                    "VALUES (%s, 100, CURDATE(), 'UPI')", (STUDENT_ID,))
+    conn.commit()
+    # the third payment's transaction is still open while the refresh runs
+    late = _scalar(db, "SELECT MAX(Payment_ID) FROM Fee_Payment") - 1
+    cur.execute("DELETE FROM Fee_Payment WHERE Payment_ID = %s", (late,))
+    conn.commit()
+    assert db.refresh_fee_rollups()["upto_payment_id"] < late
+    cur.execute("INSERT INTO Fee_Payment (Payment_ID, Student_ID, Amount, Payment_Date, Payment_Mode) "
+                "VALUES (%s, %s, 100, CURDATE(), 'UPI')", (late, STUDENT_ID))
+    conn.commit()
+    cur.close(); conn.close()
+    db.refresh_fee_rollups()
+    rolled = db.fee_analytics(use_rollups=True)["balances"]
+    assert float(rolled.loc[rolled["Student_ID"] == STUDENT_ID, "Paid"].iloc[0]) == 400
+    assert rolled.equals(db.fee_analytics(use_rollups=False)["balances"])
+
+
+def test_fee_analytics_reports_undated_payments(db, no_cache, cleanup, monkeypatch):
+    # roll everything up, so the undated payment sits below the watermark
+    monkeypatch.setattr(db, "FEE_ROLLUP_OVERLAP", 0)
+    assert db.add_student(STUDENT_ID, "Handler Test", "Female", "CSE", ROOM_ID).startswith("✅")
+    before = db.fee_analytics(use_rollups=False)
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Date, Payment_Mode) "
+                "VALUES (%s, 777, NULL, 'Cash')", (STUDENT_ID,))
+    conn.commit()
+    cur.close(); conn.close()
+    cash = lambda r: float(r["by_mode"].set_index("Payment_Mode")["Amount"].get("Cash", 0))
+    assert db.refresh_fee_rollups(rebuild=True)["undated_payments"] >= 1
+    for use_rollups in (False, True):
+        report = db.fee_analytics(use_rollups=use_rollups)
+        summary = report["summary"].iloc[0]
+        assert summary["Undated_Payments"] == before["summary"].iloc[0]["Undated_Payments"] + 1
+        assert summary["Undated_Amount"] == before["summary"].iloc[0]["Undated_Amount"] + 777
+        assert cash(report) == cash(before) + 777
+        assert "Unknown" in set(report["by_month"]["Month"])
+
+
+@pytest.mark.parametrize("name,kwargs", [
+    ("archive_history", {"dry_run": True}),
+    ("reconcile_occupancy", {"dry_run": True}),
+    ("allocate_rooms", {"dry_run": True}),
+])
+def test_maintenance_runs_recorded(db, name, kwargs):
+    runs = lambda: getattr(db.metrics.handler_seconds.get(name), "count", 0)
+    before = runs()
+    getattr(db, name)(**kwargs)
+    assert runs() == before + 1
@@ -0,0 +1,57 @@
+"""Bulk student import: rejects are reported once, including when a chunk
+fails and falls back to per-row inserts."""
+import pytest
+
+ROOM_ID = 990001
+FIRST_ID = 990101
+
+
+@pytest.fixture
+def room(db):
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("INSERT INTO Room (Room_ID, Block_Name, Room_No, Capacity, Current_Occupancy) "
+                "VALUES (%s, %s, %s, %s, 0)", (ROOM_ID, "T", "T-1", 1))
+    conn.commit()
+    cur.close(); conn.close()
+    yield ROOM_ID
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("DELETE FROM Student WHERE Student_ID >= %s", (FIRST_ID,))
+    cur.execute("DELETE FROM Room WHERE Room_ID = %s", (ROOM_ID,))
+    conn.commit()
+    cur.close(); conn.close()
+    db.invalidate_reads()
+
+
+@pytest.fixture
+def students_csv(tmp_path, room):
+    path = tmp_path / "students.csv"
+    path.write_text(
+        "Student_ID,Name,Gender,Department,Room_ID\n"
+        f"{FIRST_ID},Asha Rao,Female,CSE,{room}\n"
+        f"{FIRST_ID + 1},Meena Iyer,Female,CSE,{room}\n"      # room has one bed
+        f"{FIRST_ID},Asha Rao,Female,CSE,\n"                  # duplicate ID
+        f"{FIRST_ID + 2},Kiran Das,Male,ECE,\n"
+    )
+    return str(path)
+
+
+def _assert_report(db, report):
+    reasons = sorted(reason for _, _, reason in report["rejects"])
+    assert report["inserted"] == 2
+    assert reasons == ["Room 990001 is full", "Student_ID already exists"]
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("SELECT Current_Occupancy FROM Room WHERE Room_ID = %s", (ROOM_ID,))
+    assert cur.fetchone()[0] == 1
+    cur.close(); conn.close()
+
+
+def test_import_rejects(db, students_csv):
+    _assert_report(db, db.import_students_csv(students_csv))
+
+
+def test_failed_chunk_retries_only_checked_rows(db, students_csv, monkeypatch):
+    def fail(conn, cur, rows, deltas):
+        raise RuntimeError("chunk insert failed")
+
+    monkeypatch.setattr(db, "_import_student_chunk", fail)
+    _assert_report(db, db.import_students_csv(students_csv))
@@ -0,0 +1,47 @@
+"""The data layer and the headless CLI import without the UI stack, within
+HOSTEL_IMPORT_BUDGET_MS (`bench_hostel.py import-time` shows where the time goes)."""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_BUDGET_MS = float(os.getenv("HOSTEL_IMPORT_BUDGET_MS", "250"))
+UI_MODULES = ("gradio", "hostel_ui")
+HEAVY_MODULES = UI_MODULES + ("pandas", "numpy", "pyarrow")
+
+# pandas / numpy sit in sys.modules as lazy stubs until first attribute access
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import Hostel_management as hm
+ms = (time.perf_counter() - t0) * 1000
+{then}
+loaded = [m for m in {modules!r} if m in sys.modules and type(sys.modules[m]).__name__ != "_LazyModule"]
+print(json.dumps({{"ms": ms, "loaded": loaded}}))
+"""
+
+
+def _probe(then="", env=None):
+    proc = subprocess.run([sys.executable, "-c", PROBE.format(then=then, modules=HEAVY_MODULES)],
+                          capture_output=True, text=True, cwd=ROOT, check=True,
+                          env={**os.environ, **(env or {})})
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_import_loads_no_ui_or_pandas():
+    assert _probe()["loaded"] == []
+
+
+def test_import_within_budget():
+    # median of a few fresh interpreters; the first run also warms the .pyc cache
+    samples = [_probe()["ms"] for _ in range(5)]
+    assert statistics.median(samples) <= IMPORT_BUDGET_MS, samples
+
+
+def test_cli_report_skips_ui(tmp_path):
+    out = _probe("hm.main(['report', 'dashboard'])",
+                 env={"DB_BACKEND": "sqlite", "SQLITE_PATH": str(tmp_path / "hostel.db")})
+    assert not set(out["loaded"]) & set(UI_MODULES), out["loaded"]
+    assert "pandas" in out["loaded"]    # the report itself is a DataFrame
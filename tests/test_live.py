@@ -0,0 +1,66 @@
+"""Live Dashboard: sessions redraw from the shared snapshot, so the statements
+executed while complaints arrive do not grow with the number of sessions."""
+import pytest
+
+LIVE_TEXT = "live test: corridor light out"
+STUDENT_ID = 1
+SESSIONS = (1, 10, 100)
+WRITES = 3
+TICKS = 5
+
+
+@pytest.fixture
+def feed(db, monkeypatch):
+    monkeypatch.setattr(db, "LIVE_INTERVAL", 0.05)
+    monkeypatch.setattr(db, "_live_feed", None)
+    feed = db.get_live_feed()
+    feed.wait(0, 10)
+    yield feed
+    # stop publishing to this feed; its thread idles once nothing is dirty
+    db._live_feed = None
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("DELETE FROM Complaint WHERE Complaint_Text = %s", (LIVE_TEXT,))
+    conn.commit()
+    cur.close(); conn.close()
+    db.invalidate_reads()
+
+
+def _newest_complaint(db):
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("SELECT MAX(Complaint_ID) FROM Complaint")
+    value = cur.fetchone()[0]
+    cur.close(); conn.close()
+    return value
+
+
+def _round(db, feed, sql_count, sessions):
+    """WRITES complaints, then every session ticks TICKS times once the
+    snapshot shows the newest one. Returns (statements run while the sessions
+    ticked, sessions showing the newest complaint)."""
+    states = [{} for _ in range(sessions)]
+    before_round = feed.snapshot()[0]
+    for _ in range(WRITES):
+        status, _ = db.raise_complaint(STUDENT_ID, LIVE_TEXT)
+        assert not status.startswith("❌"), status
+    newest = _newest_complaint(db)
+    version, _, rows = feed.wait(before_round, 10)
+    while not rows or rows[0]["Complaint_ID"] < newest:
+        version, _, rows = feed.wait(version, 10)
+    before = sql_count()
+    for _ in range(TICKS):
+        states = [db.live_poll(seen)[0] for seen in states]
+    polled = sql_count() - before
+    return polled, sum(1 for s in states if s.get("last_id", 0) >= newest)
+
+
+def test_live_poll_queries_flat(db, feed, sql_count):
+    rounds = []
+    for sessions in SESSIONS:
+        before = sql_count()
+        polled, caught_up = _round(db, feed, sql_count, sessions)
+        rounds.append(sql_count() - before)
+        assert caught_up == sessions
+        # at most a late refresh of the snapshot; live_poll itself never queries
+        assert polled <= 10, (sessions, polled)
+    assert max(rounds) <= min(rounds) + 10, rounds
+    assert feed.stats()["errors"] == 0
@@ -0,0 +1,83 @@
+"""Read routing with a replica: a copy of the SQLite file stands in for a
+replica that has not caught up. Writes pin the tags they touched to the
+primary; everything else keeps reading from the replica."""
+import sqlite3
+
+import pytest
+
+AMOUNT = 4321.0
+
+
+def _summary_rows(path):
+    conn = sqlite3.connect(path)
+    n = conn.execute("SELECT COUNT(*) FROM Hostel_Summary").fetchone()[0]
+    conn.close()
+    return n
+
+
+@pytest.fixture
+def make_replica(db, tmp_path, monkeypatch, no_cache):
+    if db.DB_BACKEND != "sqlite":
+        pytest.skip("uses a copied SQLite file as the replica")
+    # column lookups are routed too; resolve them before counting replica reads
+    db.view_complaints(None); db.view_student_details(1); db.dashboard_summary()
+
+    def make():
+        path = str(tmp_path / "replica.db")
+        src, dst = sqlite3.connect(db.SQLITE_PATH), sqlite3.connect(path)
+        src.backup(dst)
+        src.close(); dst.close()
+        monkeypatch.setattr(db, "DB_REPLICAS", [path])
+        monkeypatch.setattr(db, "DB_REPLICA_MAX_LAG", 60.0)
+        monkeypatch.setattr(db, "_replicas", None)
+        monkeypatch.setattr(db, "_written_at", {})
+        return lambda: sum(r["reads"] for r in db.replica_stats()["replicas"])
+
+    yield make
+    if db._replicas is not None:
+        db._replicas.dispose()
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("DELETE FROM Fee_Payment WHERE Student_ID = 1 AND Amount = %s", (AMOUNT,))
+    conn.commit()
+    cur.close(); conn.close()
+
+
+def _paid(db, sid):
+    return float(db.view_student_details(sid)["Total_Fees_Paid"].iloc[0])
+
+
+def test_reads_use_replica(db, make_replica):
+    replica_reads = make_replica()
+    assert not db._is_error_result(db.view_complaints(None))
+    assert not db._is_error_result(db.dashboard_summary())
+    assert replica_reads() == 2
+
+
+def test_written_tags_read_from_primary(db, make_replica):
+    replica_reads = make_replica()
+    stale = _paid(db, 1)
+    assert db.add_payment(1, AMOUNT, "UPI").startswith("✅")
+    before = replica_reads()
+    assert _paid(db, 1) == stale + AMOUNT
+    assert replica_reads() == before
+    # untouched data still comes from the replica
+    db.view_complaints(None)
+    assert replica_reads() == before + 1
+    # once the lag window has passed the replica serves it again (still stale here)
+    db._written_at.clear()
+    assert _paid(db, 1) == stale
+    assert replica_reads() == before + 2
+
+
+def test_missing_summary_seeded_on_primary(db, make_replica):
+    conn = db.get_connection(); cur = conn.cursor()
+    cur.execute("DELETE FROM Hostel_Summary")
+    conn.commit()
+    cur.close(); conn.close()
+    replica_reads = make_replica()    # neither copy has the row now
+    summary = db.dashboard_summary()
+    assert replica_reads() == 1
+    assert not db._is_error_result(summary)
+    assert int(summary["Total Students"].iloc[0]) > 0
+    assert _summary_rows(db.SQLITE_PATH) == 1
+    assert _summary_rows(db.DB_REPLICAS[0]) == 0
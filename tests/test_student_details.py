@@ -0,0 +1,61 @@
+"""Student details: totals are aggregated per table (no join fan-out) and a
+lookup is one statement however much history the student has."""
+import pytest
+
+STUDENT_ID = 990001
+
+
+@pytest.fixture
+def student(db):
+    def make(payments, complaints, sid=STUDENT_ID):
+        conn = db.get_connection(); cur = conn.cursor()
+        cur.execute("INSERT INTO Student (Student_ID, Name, Gender, Department) VALUES (%s, %s, %s, %s)",
+                    (sid, "Fanout Check", "Other", "TEST"))
+        cur.executemany("INSERT INTO Fee_Payment (Student_ID, Amount, Payment_Mode) VALUES (%s, %s, %s)",
+                        [(sid, 100 + i, "Cash") for i in range(payments)])
+        cur.executemany("INSERT INTO Complaint (Student_ID, Complaint_Text) VALUES (%s, %s)",
+                        [(sid, f"fan-out check {i}") for i in range(complaints)])
+        conn.commit()
+        cur.close(); conn.close()
+        made.append(sid)
+        return sid
+
+    made = []
+    yield make
+    conn = db.get_connection(); cur = conn.cursor()
+    for sid in made:
+        for table in ("Complaint", "Fee_Payment", "Student"):
+            cur.execute(f"DELETE FROM {table} WHERE Student_ID = %s", (sid,))
+    conn.commit()
+    cur.close(); conn.close()
+    db.invalidate_reads()
+
+
+def test_totals_not_multiplied(db, student, no_cache):
+    sid = student(payments=12, complaints=10)
+    df = db.view_student_details(sid)
+    assert len(df) == 1
+    assert float(df["Total_Fees_Paid"].iloc[0]) == sum(100 + i for i in range(12))
+    assert int(df["Total_Complaints"].iloc[0]) == 10
+
+
+def test_one_statement_per_lookup(db, student, no_cache, sql_count):
+    small = student(payments=1, complaints=1, sid=STUDENT_ID)
+    large = student(payments=200, complaints=150, sid=STUDENT_ID + 1)
+    db.view_student_details(small)  # resolves columns / compiles the SQL once
+    counts = []
+    for sid in (small, large):
+        before = sql_count()
+        df = db.view_student_details(sid)
+        counts.append(sql_count() - before)
+        assert "error" not in df.columns
+    assert counts == [1, 1]
+
+
+def test_cached_lookup_runs_no_statement(db, student, sql_count, monkeypatch):
+    monkeypatch.setattr(db, "CACHE_TTL", 30)
+    sid = student(payments=3, complaints=2)
+    db.view_student_details(sid)
+    before = sql_count()
+    db.view_student_details(sid)
+    assert sql_count() == before